@@ -29,21 +29,44 @@ Examples:
         0.875
 """
 
+import os
 import time
+import gzip
 import json
+import bisect
+import random
+import asyncio
+import threading
+from http.cookiejar import DefaultCookiePolicy
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from typing import Dict, List, Optional, Any, Union, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+from urllib3.util.request import ACCEPT_ENCODING
 from enum import Enum
 
+try:
+    import httpx
+except ImportError:  # Optional: only needed for AsyncEvalClient and HTTP/2
+    httpx = None
+
+try:
+    import orjson
+except ImportError:  # Optional: faster JSON decoding when installed
+    orjson = None
+
 __version__ = "2.0.0"
 __author__ = "Evaluation Platform Team"
 __all__ = [
     "EvalClient",
+    "AsyncEvalClient",
     "Agent",
     "TestSuite",
     "Evaluation",
+    "AsyncEvaluation",
     "EvaluationResults",
     "EvalStatus",
     "EvalException"
@@ -52,7 +75,21 @@ __all__ = [
 # Configuration defaults
 DEFAULT_BASE_URL = "http://localhost:5000/v1"
 DEFAULT_TIMEOUT = 30
+POLL_INITIAL_DELAY = 0.05
+POLL_BACKOFF = 1.3
+POLL_MAX_DELAY = 10.0
+POLL_ERROR_MAX_DELAY = 60.0
+POLL_JITTER = 0.1
+# Deprecated: polling now backs off from POLL_INITIAL_DELAY. Kept so code
+# importing the old fixed interval keeps working; no longer read by the SDK.
 POLLING_INTERVAL = 2
+POOL_CONNECTIONS = 32
+POOL_MAXSIZE = 64
+MAX_RETRIES = 3
+SUITE_CACHE_TTL = 60
+LONG_POLL_WAIT = 30
+HTTP2_MAX_CONNECTIONS = 16
+GZIP_MIN_BYTES = 1024
 
 
 class EvalException(Exception):
@@ -71,6 +108,85 @@ class EvalException(Exception):
         super().__init__(self.message)
 
 
+def _json_bytes(data: Any) -> bytes:
+    """Encode a request body as JSON, using orjson when it is installed.
+
+    Args:
+        data: JSON-serializable request body
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if orjson is None:
+        return json.dumps(data).encode("utf-8")
+    # Accept int/float/etc. keys the way json.dumps does
+    return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+
+
+def _encode_body(data: Any,
+                 headers: Dict[str, str],
+                 compress: bool) -> Tuple[bytes, Dict[str, str]]:
+    """Encode a request body, gzipping it if it is large enough to benefit.
+
+    Args:
+        data: JSON-serializable request body
+        headers: Headers for the request
+        compress: Whether bodies over ``GZIP_MIN_BYTES`` may be compressed
+
+    Returns:
+        Body bytes and the headers to send with them
+    """
+    body = _json_bytes(data)
+    if compress and len(body) > GZIP_MIN_BYTES:
+        # Level 1 is several times faster than the default and still
+        # removes most of the redundancy in JSON
+        body = gzip.compress(body, compresslevel=1)
+        headers = {**headers, 'Content-Encoding': 'gzip'}
+    return body, headers
+
+
+def _json_body(response: Any) -> Dict[str, Any]:
+    """Decode a JSON response body, using orjson when it is installed.
+
+    Args:
+        response: ``requests`` or ``httpx`` response object
+
+    Returns:
+        Decoded JSON body
+
+    Raises:
+        EvalException: If the body is not valid JSON
+    """
+    try:
+        if orjson is None:
+            return response.json()
+        return orjson.loads(response.content)
+    except ValueError as e:
+        raise EvalException(f"Invalid JSON response: {e}", code="REQUEST_ERROR")
+
+
+def _raise_for_status(response: Any, endpoint: str) -> None:
+    """Raise for error responses, letting ``304 Not Modified`` through.
+
+    Args:
+        response: ``requests`` or ``httpx`` response object
+        endpoint: API endpoint path, for error messages
+
+    Raises:
+        EvalException: For authentication, not-found and server errors
+    """
+    if response.status_code == 304:
+        return
+    elif response.status_code == 401:
+        raise EvalException("Invalid API key", code="AUTH_ERROR")
+    elif response.status_code == 404:
+        raise EvalException(f"Resource not found: {endpoint}", code="NOT_FOUND")
+    elif response.status_code >= 500:
+        raise EvalException("Server error", code="SERVER_ERROR")
+
+    response.raise_for_status()
+
+
 class EvalStatus(Enum):
     """Evaluation status enumeration.
 
@@ -86,7 +202,16 @@ class EvalStatus(Enum):
     FAILED = "failed"
 
 
-@dataclass
+# Raw status strings checked on every poll, resolved once
+_COMPLETED = EvalStatus.COMPLETED.value
+_FAILED = EvalStatus.FAILED.value
+_TERMINAL = frozenset({_COMPLETED, _FAILED})
+
+# Webhook callback hosts that only need a loopback listener
+_LOOPBACK_HOSTS = frozenset({"localhost", "127.0.0.1"})
+
+
+@dataclass(slots=True)
 class Agent:
     """Represents an AI agent in the evaluation platform.
 
@@ -136,8 +261,20 @@ class Agent:
 
         Raises:
             KeyError: If required fields are missing
+
+        Note:
+            Unknown keys are ignored so newer API fields don't break parsing.
         """
-        return cls(**data)
+        return cls(
+            data["id"],
+            data["name"],
+            data["model"],
+            data["version"],
+            data.get("description", ""),
+            data.get("metadata") or {},
+            data["created_at"],
+            data["organization"]
+        )
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert agent to dictionary representation.
@@ -157,7 +294,7 @@ class Agent:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class TestSuite:
     """Represents a collection of evaluation tests.
 
@@ -197,11 +334,26 @@ class TestSuite:
 
         Returns:
             TestSuite instance
+
+        Raises:
+            KeyError: If required fields are missing
         """
-        return cls(**data)
+        return cls(
+            data["id"],
+            data["name"],
+            data.get("description", ""),
+            data["test_count"],
+            data.get("categories") or [],
+            data["created_at"]
+        )
+
 
+# Lower bounds of each letter grade, ascending; see EvaluationResults.get_grade
+_GRADE_THRESHOLDS = [0.6, 0.7, 0.8, 0.85, 0.9]
+_GRADES = ["F", "D", "C", "B", "A", "A+"]
 
-@dataclass
+
+@dataclass(slots=True)
 class EvaluationResults:
     """Results from a completed evaluation.
 
@@ -232,7 +384,13 @@ class EvaluationResults:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'EvaluationResults':
         """Create an EvaluationResults instance from a dictionary."""
-        return cls(**data)
+        return cls(
+            data["overall_score"],
+            data["passed_tests"],
+            data["failed_tests"],
+            data.get("categories") or {},
+            data["execution_time_seconds"]
+        )
 
     @property
     def pass_rate(self) -> float:
@@ -255,21 +413,142 @@ class EvaluationResults:
             >>> results.get_grade()
             'A+'
         """
-        if self.overall_score >= 0.9:
-            return "A+"
-        elif self.overall_score >= 0.85:
-            return "A"
-        elif self.overall_score >= 0.8:
-            return "B"
-        elif self.overall_score >= 0.7:
-            return "C"
-        elif self.overall_score >= 0.6:
-            return "D"
-        else:
-            return "F"
+        # NaN compares false against every threshold; grade it as a failure
+        if not self.overall_score >= _GRADE_THRESHOLDS[0]:
+            return _GRADES[0]
+        return _GRADES[bisect.bisect_right(_GRADE_THRESHOLDS, self.overall_score)]
+
+    @staticmethod
+    def grades_for(scores: Any) -> Any:
+        """Get letter grades for many scores at once.
+
+        Vectorized version of :meth:`get_grade` for bulk analysis, e.g.
+        grading every result in a regression dashboard. Requires ``numpy``.
+
+        Args:
+            scores: Array-like of overall scores from 0.0 to 1.0
+
+        Returns:
+            ``numpy.ndarray`` of letter grades, same shape as ``scores``
+
+        Examples:
+            >>> EvaluationResults.grades_for([0.92, 0.81, 0.4])
+            array(['A+', 'B', 'F'], dtype='<U2')
+            >>> EvaluationResults.grades_for([r.overall_score for r in all_results])
+        """
+        import numpy as np
+
+        scores = np.asarray(scores, dtype=float)
+        indices = np.searchsorted(_GRADE_THRESHOLDS, scores, side="right")
+        # searchsorted sorts NaN last; grade it as a failure like get_grade
+        indices = np.where(np.isnan(scores), 0, indices)
+        return np.array(_GRADES)[indices]
+
+
+class _EvaluationBase:
+    """State shared by :class:`Evaluation` and :class:`AsyncEvaluation`.
+
+    Holds the evaluation data and the status checks that don't touch the
+    network, so each subclass only implements its own (sync or async) I/O.
+    """
+
+    def __init__(self, client: Any, data: Dict[str, Any]):
+        """Initialize an Evaluation instance.
+
+        Args:
+            client: Parent EvalClient or AsyncEvalClient instance
+            data: Evaluation data from API
+        """
+        self.client = client
+        self.id = data["id"]
+        self.agent_id = data["agent_id"]
+        self.test_suite_id = data["test_suite_id"]
+        self.status = data["status"]
+        self.config = data.get("config", {})
+        self.created_at = data["created_at"]
+        self.organization = data["organization"]
+        self.results: Optional[EvaluationResults] = None
+        self._raw_data = data
+        self._etag: Optional[str] = None
+
+    def _conditional_headers(self) -> Optional[Dict[str, str]]:
+        """Get If-None-Match headers for the last seen ETag, if any."""
+        if self._etag is None:
+            return None
+        return {"If-None-Match": self._etag}
+
+    def _update(self, data: Dict[str, Any]) -> '_EvaluationBase':
+        """Apply evaluation data returned by the API.
+
+        Args:
+            data: Evaluation data from API
+
+        Returns:
+            Self for method chaining
+        """
+        self.status = data["status"]
+        self._raw_data = data
+        if "results" in data:
+            self.results = EvaluationResults.from_dict(data["results"])
+        return self
+
+    def _completed_results(self) -> Optional[EvaluationResults]:
+        """Check whether the evaluation has reached a terminal status.
+
+        Returns:
+            Results if the evaluation completed, None if it is still running
+
+        Raises:
+            EvalException: If the evaluation failed or completed without results
+        """
+        if self.status not in _TERMINAL:
+            return None
+        if self.status == _COMPLETED:
+            if self.results is None:
+                raise EvalException("Evaluation completed but no results available")
+            return self.results
+        raise EvalException(f"Evaluation {self.id} failed")
+
+    @staticmethod
+    def _pause(delay: float, start_time: float, timeout: int) -> float:
+        """Compute a jittered sleep that doesn't overshoot the deadline.
+
+        Args:
+            delay: Nominal delay in seconds
+            start_time: Time the wait started
+            timeout: Maximum seconds to wait overall
+
+        Returns:
+            Seconds to sleep before the next poll
+        """
+        delay *= 1 + random.uniform(-POLL_JITTER, POLL_JITTER)
+        remaining = timeout - (time.time() - start_time)
+        return max(0.0, min(delay, remaining))
+
+    def cancel(self) -> bool:
+        """Cancel a running evaluation.
+
+        Returns:
+            True if cancellation was successful
+
+        Raises:
+            EvalException: If cancellation fails
+
+        Note:
+            Not implemented in mock API
+        """
+        raise NotImplementedError("Cancellation not yet implemented")
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get the raw dictionary representation.
+
+        Returns:
+            Complete evaluation data as returned by the API
+        """
+        return self._raw_data
 
 
-class Evaluation:
+class Evaluation(_EvaluationBase):
     """Represents an evaluation run.
 
     An Evaluation tracks the execution of a test suite against an agent.
@@ -302,29 +581,13 @@ class Evaluation:
         until results are available, or :meth:`refresh` to poll status.
     """
 
-    def __init__(self, client: 'EvalClient', data: Dict[str, Any]):
-        """Initialize an Evaluation instance.
-
-        Args:
-            client: Parent EvalClient instance
-            data: Evaluation data from API
-        """
-        self.client = client
-        self.id = data["id"]
-        self.agent_id = data["agent_id"]
-        self.test_suite_id = data["test_suite_id"]
-        self.status = data["status"]
-        self.config = data.get("config", {})
-        self.created_at = data["created_at"]
-        self.organization = data["organization"]
-        self.results: Optional[EvaluationResults] = None
-        self._raw_data = data
-
     def refresh(self) -> 'Evaluation':
         """Refresh evaluation status from the API.
 
         Updates the local evaluation object with the latest status
-        and results from the server.
+        and results from the server. If the server sent an ETag, the
+        request is made conditional so an unchanged evaluation costs a
+        bodyless ``304 Not Modified`` instead of a full download.
 
         Returns:
             Self for method chaining
@@ -337,21 +600,44 @@ class Evaluation:
             >>> if evaluation.status == "completed":
             ...     print(evaluation.results.overall_score)
         """
-        data = self.client._get(f"/evaluations/{self.id}")
-        self.status = data["status"]
-        self._raw_data = data
-        if "results" in data:
-            self.results = EvaluationResults.from_dict(data["results"])
-        return self
-
-    def wait_for_completion(self, timeout: int = 300) -> EvaluationResults:
+        response = self.client._send("GET", f"/evaluations/{self.id}",
+                                     headers=self._conditional_headers())
+        if response.status_code == 304:
+            return self
+        self._etag = response.headers.get("ETag")
+        return self._update(_json_body(response))
+
+    def wait_for_completion(self,
+                            timeout: int = 300,
+                            mode: str = "poll",
+                            callback_host: str = "localhost") -> EvaluationResults:
         """Wait for the evaluation to complete.
 
         Blocks until the evaluation finishes or the timeout is reached.
-        Polls the API every 2 seconds for status updates.
+        How completion is detected depends on ``mode``:
+
+        - ``"poll"``: Polls the API with exponential backoff, starting at
+          50ms and growing by 1.3x per poll up to 10 seconds, so short
+          evaluations return quickly while long ones don't flood the API.
+          Transient server errors and timeouts double the delay (up to 60
+          seconds) instead of failing.
+        - ``"longpoll"``: Issues hanging ``GET /evaluations/{id}?wait=30``
+          requests that the server holds open until the status changes.
+          Falls back to polling if the server answers without waiting.
+        - ``"webhook"``: Starts a one-shot HTTP listener (on loopback when
+          ``callback_host`` is local, otherwise on all interfaces),
+          registers it at ``callback_host`` as a webhook for completion
+          events, re-checking status when notified (or every 30 seconds).
+          Falls back to polling if the webhook can't be registered.
+          Each call permanently registers an organization-wide webhook
+          that points at an ephemeral port which stops listening once the
+          call returns, so prefer the other modes for repeated waits.
 
         Args:
             timeout: Maximum seconds to wait (default: 300)
+            mode: One of "poll", "longpoll" or "webhook" (default: "poll")
+            callback_host: Host name the API server can reach this machine
+                on; only used in webhook mode (default: "localhost")
 
         Returns:
             EvaluationResults object containing scores and metrics
@@ -359,6 +645,7 @@ class Evaluation:
         Raises:
             TimeoutError: If evaluation doesn't complete within timeout
             EvalException: If evaluation fails
+            ValueError: If mode is not recognised
 
         Examples:
             >>> try:
@@ -366,44 +653,167 @@ class Evaluation:
             ...     print(f"Score: {results.overall_score}")
             ... except TimeoutError:
             ...     print("Evaluation took too long")
+
+            Waiting on a server that supports long polling::
+
+                >>> results = evaluation.wait_for_completion(mode="longpoll")
+
+        Note:
+            Webhooks registered in webhook mode are not removed afterwards,
+            as the API has no endpoint for deleting them.
         """
         start_time = time.time()
 
-        while time.time() - start_time < timeout:
-            self.refresh()
+        if mode == "poll":
+            return self._wait_poll(start_time, timeout)
+        elif mode == "longpoll":
+            return self._wait_longpoll(start_time, timeout)
+        elif mode == "webhook":
+            return self._wait_webhook(start_time, timeout, callback_host)
+        raise ValueError(f"Unsupported wait mode: {mode}")
 
-            if self.status == EvalStatus.COMPLETED.value:
-                if self.results is None:
-                    raise EvalException("Evaluation completed but no results available")
-                return self.results
-            elif self.status == EvalStatus.FAILED.value:
-                raise EvalException(f"Evaluation {self.id} failed")
+    def _wait_poll(self, start_time: float, timeout: int) -> EvaluationResults:
+        """Poll for completion with jittered exponential backoff.
 
-            time.sleep(POLLING_INTERVAL)
+        Args:
+            start_time: Time the wait started
+            timeout: Maximum seconds to wait overall
+
+        Returns:
+            EvaluationResults object containing scores and metrics
+        """
+        delay = POLL_INITIAL_DELAY
+
+        while time.time() - start_time < timeout:
+            try:
+                self.refresh()
+            except EvalException as e:
+                if e.code not in ("SERVER_ERROR", "TIMEOUT"):
+                    raise
+                delay = min(delay * 2, POLL_ERROR_MAX_DELAY)
+                time.sleep(self._pause(delay, start_time, timeout))
+                continue
+
+            results = self._completed_results()
+            if results is not None:
+                return results
+
+            delay = min(delay, POLL_MAX_DELAY)
+            time.sleep(self._pause(delay, start_time, timeout))
+            delay *= POLL_BACKOFF
 
         raise TimeoutError(f"Evaluation {self.id} timed out after {timeout} seconds")
 
-    def cancel(self) -> bool:
-        """Cancel a running evaluation.
+    def _wait_longpoll(self, start_time: float, timeout: int) -> EvaluationResults:
+        """Wait for completion using server-held GET requests.
+
+        Args:
+            start_time: Time the wait started
+            timeout: Maximum seconds to wait overall
 
         Returns:
-            True if cancellation was successful
+            EvaluationResults object containing scores and metrics
+        """
+        while True:
+            remaining = timeout - (time.time() - start_time)
+            if remaining <= 0:
+                break
+            # Never ask the server to hold, or wait on it, past the deadline
+            wait = max(1, min(LONG_POLL_WAIT, int(remaining)))
+            previous_status = self.status
+            requested_at = time.time()
+            try:
+                data = self.client._get(f"/evaluations/{self.id}",
+                                        params={"wait": wait},
+                                        timeout=min(wait + 5, remaining))
+            except EvalException as e:
+                if e.code not in ("SERVER_ERROR", "TIMEOUT"):
+                    raise
+                return self._wait_poll(start_time, timeout)
+            self._update(data)
+
+            results = self._completed_results()
+            if results is not None:
+                return results
+
+            # An unchanged status returned straight away means the server
+            # ignored ``wait``; hammering it in a tight loop would be worse
+            # than polling.
+            if (self.status == previous_status
+                    and time.time() - requested_at < wait / 2):
+                return self._wait_poll(start_time, timeout)
 
-        Raises:
-            EvalException: If cancellation fails
+        raise TimeoutError(f"Evaluation {self.id} timed out after {timeout} seconds")
 
-        Note:
-            Not implemented in mock API
-        """
-        raise NotImplementedError("Cancellation not yet implemented")
+    def _wait_webhook(self,
+                      start_time: float,
+                      timeout: int,
+                      callback_host: str) -> EvaluationResults:
+        """Wait for completion by listening for a webhook callback.
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Get the raw dictionary representation.
+        Args:
+            start_time: Time the wait started
+            timeout: Maximum seconds to wait overall
+            callback_host: Host name the API server can reach us on
 
         Returns:
-            Complete evaluation data as returned by the API
+            EvaluationResults object containing scores and metrics
         """
-        return self._raw_data
+        notified = threading.Event()
+
+        class CallbackHandler(BaseHTTPRequestHandler):
+            def do_POST(self) -> None:
+                self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                self.send_response(204)
+                self.end_headers()
+                notified.set()
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+        # A loopback callback_host only needs a loopback listener. Any other
+        # name is only advertised; it may be a NAT or public name that
+        # doesn't belong to a local interface, so listen on all of them.
+        bind_host = "127.0.0.1" if callback_host in _LOOPBACK_HOSTS else ""
+        server = ThreadingHTTPServer((bind_host, 0), CallbackHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            try:
+                self.client.webhooks.create(
+                    url=f"http://{callback_host}:{server.server_address[1]}/cb",
+                    events=["evaluation.completed", "evaluation.failed"]
+                )
+            except EvalException:
+                return self._wait_poll(start_time, timeout)
+
+            # Check once after registering in case the evaluation finished
+            # before the webhook existed, then again on each notification.
+            # Transient errors back off as in poll mode.
+            error_delay = POLL_INITIAL_DELAY
+            while True:
+                try:
+                    self.refresh()
+                except EvalException as e:
+                    if e.code not in ("SERVER_ERROR", "TIMEOUT"):
+                        raise
+                    error_delay = min(error_delay * 2, POLL_ERROR_MAX_DELAY)
+                    wait = error_delay
+                else:
+                    results = self._completed_results()
+                    if results is not None:
+                        return results
+                    wait = LONG_POLL_WAIT
+
+                remaining = timeout - (time.time() - start_time)
+                if remaining <= 0:
+                    break
+                notified.wait(min(remaining, wait))
+                notified.clear()
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        raise TimeoutError(f"Evaluation {self.id} timed out after {timeout} seconds")
 
 
 class AgentsAPI:
@@ -499,7 +909,54 @@ class AgentsAPI:
         raise NotImplementedError("Agent listing not yet implemented")
 
 
-class TestSuitesAPI:
+class _SuiteCacheBase:
+    """Test suite caching shared by the sync and async test suite APIs.
+
+    :class:`TestSuitesAPI` and :class:`AsyncTestSuitesAPI` only add their
+    own (sync or async) requests on top of these helpers.
+    """
+
+    def __init__(self, client: Any):
+        """Initialize the Test Suites API.
+
+        Args:
+            client: Parent EvalClient or AsyncEvalClient instance
+        """
+        self.client = client
+        self._cache: Dict[str, TestSuite] = {}
+        self._list_cache: Optional[Tuple[float, List[TestSuite]]] = None
+
+    def _cached_list(self) -> Optional[List[TestSuite]]:
+        """Get the cached suite list if it is younger than ``SUITE_CACHE_TTL``."""
+        if (self._list_cache is not None
+                and time.monotonic() - self._list_cache[0] < SUITE_CACHE_TTL):
+            return list(self._list_cache[1])
+        return None
+
+    def _store_suites(self, data: Dict[str, Any]) -> List[TestSuite]:
+        """Cache a ``/test-suites`` response and return its suites."""
+        suites = [TestSuite.from_dict(suite) for suite in data["test_suites"]]
+        self._list_cache = (time.monotonic(), suites)
+        self._cache.update((suite.id, suite) for suite in suites)
+        return list(suites)
+
+    def _cached_suite(self, suite_id: str) -> Optional[TestSuite]:
+        """Get a suite that was already fetched, if any."""
+        return self._cache.get(suite_id)
+
+    def _store_suite(self, suite_id: str, data: Dict[str, Any]) -> TestSuite:
+        """Cache a ``/test-suites/{id}`` response and return the suite."""
+        suite = TestSuite.from_dict(data)
+        self._cache[suite_id] = suite
+        return suite
+
+    def clear_cache(self) -> None:
+        """Discard cached test suites so the next lookup hits the API."""
+        self._cache.clear()
+        self._list_cache = None
+
+
+class TestSuitesAPI(_SuiteCacheBase):
     """API client for test suite management.
 
     Provides methods to list and retrieve available test suites.
@@ -508,15 +965,12 @@ class TestSuitesAPI:
     Examples:
         >>> suites = client.test_suites.list()
         >>> suite = client.test_suites.get("suite_001")
-    """
-
-    def __init__(self, client: 'EvalClient'):
-        """Initialize the Test Suites API.
 
-        Args:
-            client: Parent EvalClient instance
-        """
-        self.client = client
+    Note:
+        Suites are cached per client. :meth:`list` results are reused for
+        ``SUITE_CACHE_TTL`` seconds and suites fetched by ID are kept until
+        :meth:`clear_cache` is called.
+    """
 
     def list(self) -> List[TestSuite]:
         """List all available test suites.
@@ -532,28 +986,43 @@ class TestSuitesAPI:
             >>> for suite in suites:
             ...     print(f"{suite.id}: {suite.name} ({suite.test_count} tests)")
         """
-        data = self.client._get("/test-suites")
-        return [TestSuite.from_dict(suite) for suite in data["test_suites"]]
+        suites = self._cached_list()
+        if suites is None:
+            suites = self._store_suites(self.client._get("/test-suites"))
+        return suites
 
     def get(self, suite_id: str) -> Optional[TestSuite]:
         """Get a specific test suite by ID.
 
+        Fetches the suite directly, falling back to scanning :meth:`list`
+        if the server has no single-suite endpoint.
+
         Args:
             suite_id: Unique identifier of the test suite
 
         Returns:
             TestSuite object if found, None otherwise
 
+        Raises:
+            EvalException: If request fails
+
         Examples:
             >>> suite = client.test_suites.get("suite_001")
             >>> if suite:
             ...     print(suite.description)
         """
-        suites = self.list()
-        for suite in suites:
-            if suite.id == suite_id:
-                return suite
-        return None
+        suite = self._cached_suite(suite_id)
+        if suite is not None:
+            return suite
+
+        try:
+            data = self.client._get(f"/test-suites/{suite_id}")
+        except EvalException as e:
+            if e.code != "NOT_FOUND":
+                raise
+            self.list()
+            return self._cached_suite(suite_id)
+        return self._store_suite(suite_id, data)
 
 
 class EvaluationsAPI:
@@ -659,10 +1128,10 @@ class EvaluationsAPI:
             >>> for eval in response["evaluations"]:
             ...     print(f"{eval['id']}: {eval['status']}")
         """
-        params = f"page={page}&limit={min(limit, 100)}"
+        params: Dict[str, Any] = {"page": page, "limit": min(limit, 100)}
         if status:
-            params += f"&status={status}"
-        return self.client._get(f"/evaluations?{params}")
+            params["status"] = status
+        return self.client._get("/evaluations", params=params)
 
 
 class WebhooksAPI:
@@ -734,6 +1203,10 @@ class EvalClient:
         api_key: Your API authentication key
         base_url: API endpoint URL (default: http://localhost:5000/v1)
         timeout: Request timeout in seconds (default: 30)
+        session: Optional pre-configured ``requests.Session`` to use
+        http2: Send requests over HTTP/2 with ``httpx``; ``https://`` only
+            (default: False)
+        compress_requests: Gzip large request bodies (default: False)
 
     Examples:
         Basic initialization::
@@ -749,6 +1222,10 @@ class EvalClient:
             ...     timeout=60
             ... )
 
+        Multiplexing concurrent requests over one HTTP/2 connection::
+
+            >>> client = EvalClient(api_key="your_api_key", http2=True)
+
         Quick evaluation::
 
             >>> results = client.quick_evaluate(
@@ -761,19 +1238,50 @@ class EvalClient:
         EvalException: If initialization fails
     """
 
+    agents: AgentsAPI
+    test_suites: TestSuitesAPI
+    evaluations: EvaluationsAPI
+    webhooks: WebhooksAPI
+
+    # Sub-APIs are created on first access by __getattr__
+    _API_CLASSES = {
+        "agents": AgentsAPI,
+        "test_suites": TestSuitesAPI,
+        "evaluations": EvaluationsAPI,
+        "webhooks": WebhooksAPI
+    }
+
     def __init__(self,
                  api_key: str,
                  base_url: str = DEFAULT_BASE_URL,
-                 timeout: int = DEFAULT_TIMEOUT):
+                 timeout: int = DEFAULT_TIMEOUT,
+                 session: Optional[requests.Session] = None,
+                 http2: bool = False,
+                 compress_requests: bool = False):
         """Initialize the evaluation client.
 
         Args:
             api_key: Your API authentication key
             base_url: API endpoint URL
             timeout: Request timeout in seconds
+            session: Optional session to use. When omitted, the module-wide
+                session from :func:`get_session` is shared, so re-creating
+                clients reuses its connection pool.
+            http2: If True, send requests through an ``httpx.Client`` with
+                HTTP/2 enabled, so concurrent requests share one connection
+                and repeated headers are compressed. HTTP/2 is negotiated
+                over TLS, so it only applies to ``https://`` URLs; the
+                default ``http://localhost`` endpoint stays on HTTP/1.1.
+                ``session`` is not used for requests in this mode. Call
+                :meth:`close` when done.
+            compress_requests: Gzip request bodies larger than
+                ``GZIP_MIN_BYTES``. Only enable this for servers that decode
+                ``Content-Encoding: gzip`` on requests; most frameworks
+                don't, and would misread the compressed body.
 
         Raises:
             ValueError: If api_key is empty
+            ImportError: If http2 is requested without ``httpx[http2]``
         """
         if not api_key:
             raise ValueError("API key is required")
@@ -781,23 +1289,53 @@ class EvalClient:
         self.api_key = api_key
         self.base_url = base_url.rstrip('/')
         self.timeout = timeout
-        self.session = requests.Session()
-        self.session.headers.update({
+        self.compress_requests = compress_requests
+        self.session = session if session is not None else get_session()
+        # Sent per request rather than set on the session, which may be shared
+        self._headers = {
             'X-API-Key': api_key,
             'Content-Type': 'application/json',
+            'Accept-Encoding': ACCEPT_ENCODING,
             'User-Agent': f'agent-eval-sdk/{__version__}'
-        })
+        }
+        self._http2_client = None
+        if http2:
+            if httpx is None:
+                raise ImportError("http2=True requires httpx: pip install 'httpx[http2]'")
+            self._http2_client = httpx.Client(
+                http2=True,
+                timeout=timeout,
+                limits=httpx.Limits(max_connections=HTTP2_MAX_CONNECTIONS),
+                # Match requests, which follows redirects by default
+                follow_redirects=True
+            )
+
+    def __getattr__(self, name: str) -> Any:
+        """Create a sub-API on first access and cache it on the instance.
 
-        # Initialize API modules
-        self.agents = AgentsAPI(self)
-        self.test_suites = TestSuitesAPI(self)
-        self.evaluations = EvaluationsAPI(self)
-        self.webhooks = WebhooksAPI(self)
+        Args:
+            name: Attribute name
+
+        Returns:
+            Sub-API instance
+
+        Raises:
+            AttributeError: If name is not a sub-API
+        """
+        api_class = self._API_CLASSES.get(name)
+        if api_class is None:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        api = api_class(self)
+        self.__dict__[name] = api
+        return api
 
     def _request(self,
                  method: str,
                  endpoint: str,
-                 data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+                 data: Optional[Dict[str, Any]] = None,
+                 params: Optional[Dict[str, Any]] = None,
+                 timeout: Optional[float] = None,
+                 headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
         """Make HTTP request to API.
 
         Internal method for API communication.
@@ -806,50 +1344,119 @@ class EvalClient:
             method: HTTP method (GET or POST)
             endpoint: API endpoint path
             data: Request body for POST requests
+            params: Query string parameters
+            timeout: Request timeout in seconds, overriding the client default
+            headers: Extra headers for this request
 
         Returns:
             JSON response as dictionary
 
+        Raises:
+            EvalException: If request fails
+        """
+        response = self._send(method, endpoint, data, params, timeout, headers)
+        return _json_body(response)
+
+    def _send(self,
+              method: str,
+              endpoint: str,
+              data: Optional[Dict[str, Any]] = None,
+              params: Optional[Dict[str, Any]] = None,
+              timeout: Optional[float] = None,
+              headers: Optional[Dict[str, str]] = None) -> Any:
+        """Send HTTP request to API and check the response status.
+
+        Like :meth:`_request`, but returns the raw response so callers can
+        read headers or handle ``304 Not Modified`` themselves.
+
+        Args:
+            method: HTTP method (GET or POST)
+            endpoint: API endpoint path
+            data: Request body for POST requests
+            params: Query string parameters
+            timeout: Request timeout in seconds, overriding the client default
+            headers: Extra headers for this request
+
+        Returns:
+            HTTP response with a 2xx or 304 status (an ``httpx.Response``
+            in HTTP/2 mode, otherwise a ``requests.Response``)
+
         Raises:
             EvalException: If request fails
         """
         url = f"{self.base_url}{endpoint}"
+        timeout = timeout or self.timeout
+        headers = {**self._headers, **headers} if headers else self._headers
+
+        if self._http2_client is not None:
+            return self._send_http2(method, url, endpoint, data, params, timeout, headers)
 
         try:
             if method == "GET":
-                response = self.session.get(url, timeout=self.timeout)
+                response = self.session.get(url, params=params, headers=headers,
+                                            timeout=timeout)
             elif method == "POST":
-                response = self.session.post(url, json=data, timeout=self.timeout)
+                body, headers = _encode_body(data, headers, self.compress_requests)
+                response = self.session.post(url, data=body, headers=headers,
+                                             timeout=timeout)
             else:
                 raise ValueError(f"Unsupported method: {method}")
 
-            if response.status_code == 401:
-                raise EvalException("Invalid API key", code="AUTH_ERROR")
-            elif response.status_code == 404:
-                raise EvalException(f"Resource not found: {endpoint}", code="NOT_FOUND")
-            elif response.status_code >= 500:
-                raise EvalException("Server error", code="SERVER_ERROR")
-
-            response.raise_for_status()
-            return response.json()
+            _raise_for_status(response, endpoint)
+            return response
 
         except requests.exceptions.Timeout:
-            raise EvalException(f"Request timed out after {self.timeout}s", code="TIMEOUT")
+            raise EvalException(f"Request timed out after {timeout}s", code="TIMEOUT")
         except requests.exceptions.ConnectionError:
             raise EvalException("Connection failed", code="CONNECTION_ERROR")
         except requests.exceptions.RequestException as e:
             raise EvalException(f"API request failed: {str(e)}", code="REQUEST_ERROR")
 
-    def _get(self, endpoint: str) -> Dict[str, Any]:
+    def _send_http2(self,
+                    method: str,
+                    url: str,
+                    endpoint: str,
+                    data: Optional[Dict[str, Any]],
+                    params: Optional[Dict[str, Any]],
+                    timeout: float,
+                    headers: Dict[str, str]) -> 'httpx.Response':
+        """Send a request through the HTTP/2 client. See :meth:`_send`."""
+        try:
+            if method == "GET":
+                response = self._http2_client.get(url, params=params, headers=headers,
+                                                  timeout=timeout)
+            elif method == "POST":
+                body, headers = _encode_body(data, headers, self.compress_requests)
+                response = self._http2_client.post(url, content=body, headers=headers,
+                                                   timeout=timeout)
+            else:
+                raise ValueError(f"Unsupported method: {method}")
+
+            _raise_for_status(response, endpoint)
+            return response
+
+        except httpx.TimeoutException:
+            raise EvalException(f"Request timed out after {timeout}s", code="TIMEOUT")
+        except httpx.ConnectError:
+            raise EvalException("Connection failed", code="CONNECTION_ERROR")
+        except httpx.HTTPError as e:
+            raise EvalException(f"API request failed: {str(e)}", code="REQUEST_ERROR")
+
+    def _get(self,
+             endpoint: str,
+             params: Optional[Dict[str, Any]] = None,
+             timeout: Optional[float] = None) -> Dict[str, Any]:
         """Make GET request.
 
         Args:
             endpoint: API endpoint path
+            params: Query string parameters
+            timeout: Request timeout in seconds, overriding the client default
 
         Returns:
             JSON response
         """
-        return self._request("GET", endpoint)
+        return self._request("GET", endpoint, params=params, timeout=timeout)
 
     def _post(self, endpoint: str, data: Dict[str, Any]) -> Dict[str, Any]:
         """Make POST request.
@@ -933,12 +1540,540 @@ class EvalClient:
             # Return evaluation object for async handling
             return evaluation
 
+    def close(self) -> None:
+        """Close the HTTP/2 connection pool, if one was created.
+
+        The shared ``requests`` session is left open for other clients.
+        """
+        if self._http2_client is not None:
+            self._http2_client.close()
+
     def __repr__(self) -> str:
         """String representation of the client."""
         return f"EvalClient(base_url='{self.base_url}')"
 
 
+class AsyncEvaluation(_EvaluationBase):
+    """Asynchronous counterpart of :class:`Evaluation`.
+
+    Returned by :class:`AsyncEvalClient`. :meth:`refresh` and
+    :meth:`wait_for_completion` are coroutines, so many evaluations can be
+    awaited concurrently with ``asyncio.gather``.
+
+    Examples:
+        >>> evaluation = await client.evaluations.create("agent_123", "suite_001")
+        >>> results = await evaluation.wait_for_completion()
+    """
+
+    client: 'AsyncEvalClient'
+
+    async def refresh(self) -> 'AsyncEvaluation':
+        """Refresh evaluation status from the API.
+
+        Returns:
+            Self for method chaining
+
+        Raises:
+            EvalException: If the API request fails
+        """
+        response = await self.client._send("GET", f"/evaluations/{self.id}",
+                                           headers=self._conditional_headers())
+        if response.status_code == 304:
+            return self
+        self._etag = response.headers.get("ETag")
+        self._update(_json_body(response))
+        return self
+
+    async def wait_for_completion(self, timeout: int = 300) -> EvaluationResults:
+        """Wait for the evaluation to complete without blocking the event loop.
+
+        Uses the same backoff schedule as :meth:`Evaluation.wait_for_completion`
+        in poll mode.
+
+        Args:
+            timeout: Maximum seconds to wait (default: 300)
+
+        Returns:
+            EvaluationResults object containing scores and metrics
+
+        Raises:
+            TimeoutError: If evaluation doesn't complete within timeout
+            EvalException: If evaluation fails
+        """
+        start_time = time.time()
+        delay = POLL_INITIAL_DELAY
+
+        while time.time() - start_time < timeout:
+            try:
+                await self.refresh()
+            except EvalException as e:
+                if e.code not in ("SERVER_ERROR", "TIMEOUT"):
+                    raise
+                delay = min(delay * 2, POLL_ERROR_MAX_DELAY)
+                await asyncio.sleep(self._pause(delay, start_time, timeout))
+                continue
+
+            results = self._completed_results()
+            if results is not None:
+                return results
+
+            delay = min(delay, POLL_MAX_DELAY)
+            await asyncio.sleep(self._pause(delay, start_time, timeout))
+            delay *= POLL_BACKOFF
+
+        raise TimeoutError(f"Evaluation {self.id} timed out after {timeout} seconds")
+
+
+class AsyncAgentsAPI:
+    """Asynchronous agent management API.
+
+    Access via `client.agents` on an :class:`AsyncEvalClient`.
+    """
+
+    def __init__(self, client: 'AsyncEvalClient'):
+        """Initialize the Agents API.
+
+        Args:
+            client: Parent AsyncEvalClient instance
+        """
+        self.client = client
+
+    async def create(self,
+                     name: str,
+                     model: str = "unknown",
+                     version: str = "1.0.0",
+                     description: str = "",
+                     metadata: Optional[Dict[str, Any]] = None) -> Agent:
+        """Create a new agent. See :meth:`AgentsAPI.create`."""
+        data = await self.client._post("/agents", {
+            "name": name,
+            "model": model,
+            "version": version,
+            "description": description,
+            "metadata": metadata or {}
+        })
+        return Agent.from_dict(data)
+
+    async def get(self, agent_id: str) -> Agent:
+        """Retrieve an agent by ID. See :meth:`AgentsAPI.get`."""
+        data = await self.client._get(f"/agents/{agent_id}")
+        return Agent.from_dict(data)
+
+
+class AsyncTestSuitesAPI(_SuiteCacheBase):
+    """Asynchronous test suite discovery API.
+
+    Access via `client.test_suites` on an :class:`AsyncEvalClient`. Caches
+    suites the same way as :class:`TestSuitesAPI`.
+    """
+
+    async def list(self) -> List[TestSuite]:
+        """List all available test suites. See :meth:`TestSuitesAPI.list`."""
+        suites = self._cached_list()
+        if suites is None:
+            suites = self._store_suites(await self.client._get("/test-suites"))
+        return suites
+
+    async def get(self, suite_id: str) -> Optional[TestSuite]:
+        """Get a specific test suite by ID. See :meth:`TestSuitesAPI.get`."""
+        suite = self._cached_suite(suite_id)
+        if suite is not None:
+            return suite
+
+        try:
+            data = await self.client._get(f"/test-suites/{suite_id}")
+        except EvalException as e:
+            if e.code != "NOT_FOUND":
+                raise
+            await self.list()
+            return self._cached_suite(suite_id)
+        return self._store_suite(suite_id, data)
+
+
+class AsyncEvaluationsAPI:
+    """Asynchronous evaluation management API.
+
+    Access via `client.evaluations` on an :class:`AsyncEvalClient`.
+    """
+
+    def __init__(self, client: 'AsyncEvalClient'):
+        """Initialize the Evaluations API.
+
+        Args:
+            client: Parent AsyncEvalClient instance
+        """
+        self.client = client
+
+    async def create(self,
+                     agent_id: str,
+                     test_suite_id: str,
+                     config: Optional[Dict[str, Any]] = None) -> AsyncEvaluation:
+        """Create a new evaluation run. See :meth:`EvaluationsAPI.create`."""
+        data = await self.client._post("/evaluations", {
+            "agent_id": agent_id,
+            "test_suite_id": test_suite_id,
+            "config": config or {}
+        })
+        return AsyncEvaluation(self.client, data)
+
+    async def get(self, eval_id: str) -> AsyncEvaluation:
+        """Retrieve an evaluation by ID. See :meth:`EvaluationsAPI.get`."""
+        data = await self.client._get(f"/evaluations/{eval_id}")
+        return AsyncEvaluation(self.client, data)
+
+    async def list(self,
+                   page: int = 1,
+                   limit: int = 10,
+                   status: Optional[str] = None) -> Dict[str, Any]:
+        """List evaluations with pagination. See :meth:`EvaluationsAPI.list`."""
+        params: Dict[str, Any] = {"page": page, "limit": min(limit, 100)}
+        if status:
+            params["status"] = status
+        return await self.client._get("/evaluations", params=params)
+
+
+class AsyncWebhooksAPI:
+    """Asynchronous webhook management API.
+
+    Access via `client.webhooks` on an :class:`AsyncEvalClient`.
+    """
+
+    def __init__(self, client: 'AsyncEvalClient'):
+        """Initialize the Webhooks API.
+
+        Args:
+            client: Parent AsyncEvalClient instance
+        """
+        self.client = client
+
+    async def create(self,
+                     url: str,
+                     events: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Register a webhook endpoint. See :meth:`WebhooksAPI.create`."""
+        return await self.client._post("/webhooks", {
+            "url": url,
+            "events": events or ["evaluation.completed"]
+        })
+
+
+class AsyncEvalClient:
+    """Asynchronous client for the AI Agent Evaluation Platform.
+
+    Mirrors :class:`EvalClient`, but every API call is a coroutine backed by
+    a pooled ``httpx.AsyncClient``. Use it to run many evaluations
+    concurrently from a single event loop. Requires ``httpx``.
+
+    Attributes:
+        agents: Agent management API
+        test_suites: Test suite discovery API
+        evaluations: Evaluation management API
+        webhooks: Webhook management API
+
+    Args:
+        api_key: Your API authentication key
+        base_url: API endpoint URL (default: http://localhost:5000/v1)
+        timeout: Request timeout in seconds (default: 30)
+        compress_requests: Gzip large request bodies (default: False)
+
+    Examples:
+        Evaluating several agents at once::
+
+            >>> async with AsyncEvalClient(api_key="your_api_key") as client:
+            ...     results = await client.quick_evaluate_many([
+            ...         {"agent_name": "Agent A", "agent_model": "gpt-4"},
+            ...         {"agent_name": "Agent B", "agent_model": "claude-2"},
+            ...     ])
+    """
+
+    agents: AsyncAgentsAPI
+    test_suites: AsyncTestSuitesAPI
+    evaluations: AsyncEvaluationsAPI
+    webhooks: AsyncWebhooksAPI
+
+    # Sub-APIs are created on first access by __getattr__
+    _API_CLASSES = {
+        "agents": AsyncAgentsAPI,
+        "test_suites": AsyncTestSuitesAPI,
+        "evaluations": AsyncEvaluationsAPI,
+        "webhooks": AsyncWebhooksAPI
+    }
+
+    def __init__(self,
+                 api_key: str,
+                 base_url: str = DEFAULT_BASE_URL,
+                 timeout: int = DEFAULT_TIMEOUT,
+                 compress_requests: bool = False):
+        """Initialize the asynchronous evaluation client.
+
+        Args:
+            api_key: Your API authentication key
+            base_url: API endpoint URL
+            timeout: Request timeout in seconds
+            compress_requests: Gzip request bodies larger than
+                ``GZIP_MIN_BYTES``. See :class:`EvalClient`.
+
+        Raises:
+            ValueError: If api_key is empty
+            ImportError: If httpx is not installed
+        """
+        if not api_key:
+            raise ValueError("API key is required")
+        if httpx is None:
+            raise ImportError("AsyncEvalClient requires httpx: pip install httpx")
+
+        self.api_key = api_key
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+        self.compress_requests = compress_requests
+        self._client = httpx.AsyncClient(
+            headers={
+                'X-API-Key': api_key,
+                'Content-Type': 'application/json',
+                'User-Agent': f'agent-eval-sdk/{__version__}'
+            },
+            timeout=timeout,
+            # Match requests, which follows redirects by default
+            follow_redirects=True,
+            limits=httpx.Limits(
+                max_connections=POOL_MAXSIZE,
+                max_keepalive_connections=POOL_CONNECTIONS
+            )
+        )
+
+    def __getattr__(self, name: str) -> Any:
+        """Create a sub-API on first access. See :meth:`EvalClient.__getattr__`."""
+        api_class = self._API_CLASSES.get(name)
+        if api_class is None:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        api = api_class(self)
+        self.__dict__[name] = api
+        return api
+
+    async def _request(self,
+                       method: str,
+                       endpoint: str,
+                       data: Optional[Dict[str, Any]] = None,
+                       params: Optional[Dict[str, Any]] = None,
+                       headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        """Make HTTP request to API.
+
+        Internal method for API communication.
+
+        Args:
+            method: HTTP method (GET or POST)
+            endpoint: API endpoint path
+            data: Request body for POST requests
+            params: Query string parameters
+            headers: Extra headers for this request
+
+        Returns:
+            JSON response as dictionary
+
+        Raises:
+            EvalException: If request fails
+        """
+        response = await self._send(method, endpoint, data, params, headers)
+        return _json_body(response)
+
+    async def _send(self,
+                    method: str,
+                    endpoint: str,
+                    data: Optional[Dict[str, Any]] = None,
+                    params: Optional[Dict[str, Any]] = None,
+                    headers: Optional[Dict[str, str]] = None) -> 'httpx.Response':
+        """Send HTTP request to API and check the response status.
+
+        See :meth:`EvalClient._send`.
+
+        Args:
+            method: HTTP method (GET or POST)
+            endpoint: API endpoint path
+            data: Request body for POST requests
+            params: Query string parameters
+            headers: Extra headers for this request
+
+        Returns:
+            HTTP response with a 2xx or 304 status
+
+        Raises:
+            EvalException: If request fails
+        """
+        url = f"{self.base_url}{endpoint}"
+
+        try:
+            if method == "GET":
+                response = await self._client.get(url, params=params, headers=headers)
+            elif method == "POST":
+                body, headers = _encode_body(data, headers or {}, self.compress_requests)
+                response = await self._client.post(url, content=body, headers=headers)
+            else:
+                raise ValueError(f"Unsupported method: {method}")
+
+            _raise_for_status(response, endpoint)
+            return response
+
+        except httpx.TimeoutException:
+            raise EvalException(f"Request timed out after {self.timeout}s", code="TIMEOUT")
+        except httpx.ConnectError:
+            raise EvalException("Connection failed", code="CONNECTION_ERROR")
+        except httpx.HTTPError as e:
+            raise EvalException(f"API request failed: {str(e)}", code="REQUEST_ERROR")
+
+    async def _get(self,
+                   endpoint: str,
+                   params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Make GET request.
+
+        Args:
+            endpoint: API endpoint path
+            params: Query string parameters
+
+        Returns:
+            JSON response
+        """
+        return await self._request("GET", endpoint, params=params)
+
+    async def _post(self, endpoint: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Make POST request.
+
+        Args:
+            endpoint: API endpoint path
+            data: Request body
+
+        Returns:
+            JSON response
+        """
+        return await self._request("POST", endpoint, data)
+
+    async def health_check(self) -> Dict[str, Any]:
+        """Check API health status. See :meth:`EvalClient.health_check`."""
+        return await self._get("/health")
+
+    async def quick_evaluate(self,
+                             agent_name: str,
+                             agent_model: str,
+                             test_suite_id: str = "suite_001",
+                             wait: bool = True) -> Union[EvaluationResults, AsyncEvaluation]:
+        """Create an agent and evaluate it. See :meth:`EvalClient.quick_evaluate`."""
+        agent = await self.agents.create(name=agent_name, model=agent_model)
+        evaluation = await self.evaluations.create(agent.id, test_suite_id)
+
+        if wait:
+            return await evaluation.wait_for_completion()
+        else:
+            return evaluation
+
+    async def quick_evaluate_many(self,
+                                  specs: List[Dict[str, Any]],
+                                  concurrency: int = 8) -> List[EvaluationResults]:
+        """Run several quick evaluations concurrently.
+
+        Args:
+            specs: Keyword arguments for :meth:`quick_evaluate`, one dict
+                per evaluation (``agent_name``, ``agent_model`` and
+                optionally ``test_suite_id``)
+            concurrency: Maximum number of evaluations in flight at once
+
+        Returns:
+            EvaluationResults in the same order as ``specs``
+
+        Raises:
+            EvalException: If any evaluation fails
+            TimeoutError: If any evaluation times out
+
+        Examples:
+            >>> results = await client.quick_evaluate_many([
+            ...     {"agent_name": "Agent A", "agent_model": "gpt-4"},
+            ...     {"agent_name": "Agent B", "agent_model": "gpt-4",
+            ...      "test_suite_id": "suite_002"},
+            ... ], concurrency=4)
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def run(spec: Dict[str, Any]) -> EvaluationResults:
+            async with semaphore:
+                return await self.quick_evaluate(**spec, wait=True)
+
+        return list(await asyncio.gather(*(run(spec) for spec in specs)))
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        await self._client.aclose()
+
+    async def __aenter__(self) -> 'AsyncEvalClient':
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    def __repr__(self) -> str:
+        """String representation of the client."""
+        return f"AsyncEvalClient(base_url='{self.base_url}')"
+
+
 # Utility functions
+_SHARED_SESSION: Optional[requests.Session] = None
+_SHARED_SESSION_LOCK = threading.Lock()
+
+
+def _reset_shared_session() -> None:
+    """Drop the shared session in a forked child.
+
+    Pooled sockets would otherwise be shared with the parent, and the lock
+    may have been held by another thread at fork time.
+    """
+    global _SHARED_SESSION, _SHARED_SESSION_LOCK
+    _SHARED_SESSION = None
+    _SHARED_SESSION_LOCK = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_shared_session)
+
+
+def get_session() -> requests.Session:
+    """Get the session shared by clients created without their own.
+
+    The session is created on first use with a connection pool sized for
+    concurrent polling and retries on transient gateway errors (502, 503,
+    504). Reusing it across :class:`EvalClient` instances keeps connections
+    alive in notebooks and scripts that re-create the client.
+
+    Returns:
+        Module-wide ``requests.Session``
+
+    Note:
+        The session rejects all cookies, since it isn't tied to one API key.
+        Headers set on it apply to every client sharing it. Pass
+        ``session=`` to :class:`EvalClient` to isolate a client. A forked
+        child process gets a fresh session rather than the parent's.
+    """
+    global _SHARED_SESSION
+    with _SHARED_SESSION_LOCK:
+        if _SHARED_SESSION is None:
+            session = requests.Session()
+            # Clients with different API keys share this session, so a
+            # cookie set for one must never be sent on behalf of another
+            session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+            adapter = HTTPAdapter(
+                pool_connections=POOL_CONNECTIONS,
+                pool_maxsize=POOL_MAXSIZE,
+                max_retries=Retry(
+                    total=MAX_RETRIES,
+                    # A read timeout already spent the caller's time budget
+                    # (long polls size it to their deadline); don't repeat it
+                    read=False,
+                    backoff_factor=0.2,
+                    status_forcelist=[502, 503, 504],
+                    raise_on_status=False
+                )
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _SHARED_SESSION = session
+        return _SHARED_SESSION
+
+
 def get_client_from_env() -> EvalClient:
     """Create a client using environment variables.
 
@@ -958,8 +2093,6 @@ def get_client_from_env() -> EvalClient:
         >>> os.environ['EVAL_API_KEY'] = 'your_key'
         >>> client = get_client_from_env()
     """
-    import os
-
     api_key = os.environ.get("EVAL_API_KEY")
     if not api_key:
         raise ValueError("EVAL_API_KEY environment variable not set")
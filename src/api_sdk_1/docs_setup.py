@@ -9,540 +9,189 @@ This script sets up and demonstrates multiple documentation generation approache
 """
 
 import os
+import logging
+import re
+import gzip
 import sys
+import time
 import subprocess
+import importlib.util
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import cache
+from importlib.metadata import distributions
 from pathlib import Path
 
+try:
+    import brotli
+except ImportError:  # Optional: .br sidecars are skipped without it
+    brotli = None
+
+
+# Every path is anchored here rather than left relative, because in-process
+# tools such as Sphinx change the working directory while they run
+ROOT = Path.cwd()
+SDK_SOURCE = Path(__file__).with_name("agent_eval_sdk.py")
+
 
 # === SETUP SCRIPT ===
 
 def setup_directories():
     """Create directory structure for documentation"""
-    dirs = [
-        "docs",
-        "docs/source",
-        "docs/build",
-        "docs/api",
-        "docs/guides",
-        "docs/examples"
-    ]
-    for d in dirs:
-        Path(d).mkdir(parents=True, exist_ok=True)
+    make_doc_dirs("source", "build", "api", "guides", "examples")
     print("✅ Directory structure created")
 
 
+def make_doc_dirs(*names):
+    """Create docs/ and the named subdirectories directly beneath it"""
+    docs = ROOT / "docs"
+    docs.mkdir(exist_ok=True)
+    # Every entry is a direct child of docs/, so skip the parents=True walk
+    for name in names:
+        (docs / name).mkdir(exist_ok=True)
+
+
 def install_doc_tools():
     """Install documentation generation tools"""
     packages = [
         "sphinx",
         "sphinx-rtd-theme",
-        "sphinx-autodoc-typehints",
         "pdoc",
         "mkdocs",
         "mkdocs-material",
         "mkdocstrings[python]",
-        "black"  # For code formatting in docs
+        "black",  # For code formatting in docs
+        "brotli"  # For precompressed .br site assets
     ]
-
-    print("Installing documentation tools...")
-    for package in packages:
-        subprocess.check_call([sys.executable, "-m", "pip", "install", package])
+    modules = ["sphinx", "sphinx_rtd_theme", "pdoc",
+               "mkdocs", "material", "mkdocstrings", "black", "brotli"]
+
+    # Finding every module through the import system is far cheaper than
+    # scanning distribution metadata, so check that first
+    if all(importlib.util.find_spec(m) is not None for m in modules):
+        print("✅ Documentation tools already installed")
+        return
+
+    # Only hand pip what's missing, in a single invocation
+    installed = {_normalize_name(d.metadata["Name"])
+                 for d in distributions() if d.metadata["Name"]}
+    missing = [p for p in packages if _normalize_name(p.split("[")[0]) not in installed]
+    if not missing:
+        print("✅ Documentation tools already installed")
+        return
+
+    print(f"Installing documentation tools: {', '.join(missing)}...")
+    spawn([*_PIP, "install", "--no-input", *missing])
     print("✅ Documentation tools installed")
 
 
-# === SPHINX CONFIGURATION ===
-
-SPHINX_CONF = '''# docs/source/conf.py
-"""Sphinx configuration for Agent Evaluation SDK"""
-
-import os
-import sys
-sys.path.insert(0, os.path.abspath('../..'))
-
-# Project information
-project = 'Agent Evaluation SDK'
-copyright = '2024, Evaluation Platform Team'
-author = 'Evaluation Platform Team'
-release = '2.0.0'
-
-# Extensions
-extensions = [
-    'sphinx.ext.autodoc',
-    'sphinx.ext.napoleon',  # Google/NumPy style docstrings
-    'sphinx.ext.viewcode',
-    'sphinx.ext.intersphinx',
-    'sphinx.ext.coverage',
-    'sphinx_autodoc_typehints',
-]
-
-# Extension settings
-autodoc_default_options = {
-    'members': True,
-    'member-order': 'bysource',
-    'special-members': '__init__',
-    'undoc-members': True,
-    'exclude-members': '__weakref__'
-}
-
-# Napoleon settings for Google-style docstrings
-napoleon_google_docstring = True
-napoleon_numpy_docstring = True
-napoleon_include_init_with_doc = True
-napoleon_include_private_with_doc = False
-napoleon_include_special_with_doc = True
-napoleon_use_param = True
-napoleon_use_rtype = True
-napoleon_type_aliases = None
-
-# Type hints
-typehints_fully_qualified = False
-always_document_param_types = True
-
-# Intersphinx mapping
-intersphinx_mapping = {
-    'python': ('https://docs.python.org/3', None),
-    'requests': ('https://requests.readthedocs.io/en/master/', None),
-}
-
-# Theme
-html_theme = 'sphinx_rtd_theme'
-html_theme_options = {
-    'navigation_depth': 4,
-    'collapse_navigation': False,
-    'sticky_navigation': True,
-    'includehidden': True,
-    'titles_only': False
-}
-
-# Static files
-html_static_path = ['_static']
-html_css_files = ['custom.css']
-
-# Output
-html_title = "Agent Evaluation SDK Documentation"
-html_short_title = "Eval SDK"
-html_logo = None
-html_favicon = None
-'''
-
-SPHINX_INDEX = '''.. Agent Evaluation SDK documentation
-
-Agent Evaluation SDK Documentation
-===================================
-
-Welcome to the Agent Evaluation SDK documentation!
-
-.. toctree::
-   :maxdepth: 2
-   :caption: Getting Started
-
-   quickstart
-   installation
-   authentication
-
-.. toctree::
-   :maxdepth: 2
-   :caption: User Guide
-
-   guides/basic_usage
-   guides/advanced_features
-   guides/best_practices
-
-.. toctree::
-   :maxdepth: 2
-   :caption: API Reference
-
-   api/client
-   api/agents
-   api/evaluations
-   api/results
-
-.. toctree::
-   :maxdepth: 1
-   :caption: Examples
-
-   examples/ci_integration
-   examples/batch_processing
-   examples/webhooks
-
-API Documentation
------------------
-
-.. automodule:: agent_eval_sdk
-   :members:
-   :undoc-members:
-   :show-inheritance:
-
-Client
-------
-
-.. autoclass:: agent_eval_sdk.EvalClient
-   :members:
-   :undoc-members:
-   :show-inheritance:
-
-Models
-------
-
-.. autoclass:: agent_eval_sdk.Agent
-   :members:
-   :show-inheritance:
-
-.. autoclass:: agent_eval_sdk.TestSuite
-   :members:
-   :show-inheritance:
-
-.. autoclass:: agent_eval_sdk.Evaluation
-   :members:
-   :show-inheritance:
+def _normalize_name(name):
+    """Normalize a distribution name for comparison (PEP 503)"""
+    return re.sub(r"[-_.]+", "-", name).lower()
 
-.. autoclass:: agent_eval_sdk.EvaluationResults
-   :members:
-   :show-inheritance:
 
-Indices and tables
-==================
+# Resolved once at import and reused by every pip invocation
+_PY = sys.executable
+_PIP = [_PY, "-m", "pip", "--disable-pip-version-check"]
 
-* :ref:`genindex`
-* :ref:`modindex`
-* :ref:`search`
-'''
+# Set by --verbose; otherwise tool output is discarded rather than streamed
+VERBOSE = False
 
-SPHINX_QUICKSTART = '''Quickstart Guide
-================
 
-This guide will get you up and running with the Agent Evaluation SDK in 5 minutes.
+def spawn(argv):
+    """Run argv to completion, raising RuntimeError if it exits non-zero
 
-Installation
-------------
-
-Install the SDK using pip::
-
-    pip install agent-eval-sdk
-
-Basic Usage
------------
-
-1. Import and initialize the client::
-
-    from agent_eval_sdk import EvalClient
-
-    client = EvalClient(api_key="your_api_key")
-
-2. Create an agent::
-
-    agent = client.agents.create(
-        name="My Agent",
-        model="gpt-4"
-    )
-
-3. Run an evaluation::
-
-    evaluation = client.evaluations.create(
-        agent_id=agent.id,
-        test_suite_id="suite_001"
-    )
-
-    results = evaluation.wait_for_completion()
-    print(f"Score: {results.overall_score}")
-
-Quick Evaluation
-----------------
-
-For rapid testing, use the convenience method::
-
-    results = client.quick_evaluate(
-        agent_name="Test Agent",
-        agent_model="gpt-4"
-    )
+    posix_spawn starts the child without fork()'s copy of the parent's page
+    tables, which subprocess would otherwise pay on every tool invocation.
+    Platforms without it (Windows) fall back to subprocess.
+    """
+    if not hasattr(os, "posix_spawn"):
+        output = None if VERBOSE else subprocess.DEVNULL
+        code = subprocess.run(argv, stdout=output, stderr=output).returncode
+        _check_exit(argv, code)
+        return
 
-Next Steps
-----------
-
-- Read the :doc:`guides/basic_usage` for detailed examples
-- Explore :doc:`api/client` for complete API reference
-- Check out :doc:`examples/ci_integration` for CI/CD integration
-'''
-
-# === MKDOCS CONFIGURATION ===
-
-MKDOCS_CONFIG = '''# mkdocs.yml
-site_name: Agent Evaluation SDK
-site_description: Python SDK for AI Agent Evaluation Platform
-site_author: Evaluation Platform Team
-site_url: https://docs.eval.ai
-
-repo_name: eval-ai/python-sdk
-repo_url: https://github.com/eval-ai/python-sdk
-edit_uri: edit/main/docs/
-
-theme:
-  name: material
-  palette:
-    - scheme: default
-      primary: indigo
-      accent: indigo
-      toggle:
-        icon: material/brightness-7
-        name: Switch to dark mode
-    - scheme: slate
-      primary: indigo
-      accent: indigo
-      toggle:
-        icon: material/brightness-4
-        name: Switch to light mode
-
-  features:
-    - navigation.instant
-    - navigation.tracking
-    - navigation.tabs
-    - navigation.tabs.sticky
-    - navigation.sections
-    - navigation.expand
-    - navigation.path
-    - navigation.top
-    - search.suggest
-    - search.highlight
-    - content.code.copy
-    - content.code.annotate
-
-plugins:
-  - search
-  - mkdocstrings:
-      handlers:
-        python:
-          options:
-            docstring_style: google
-            show_source: true
-            show_signature_annotations: true
-            show_if_no_docstring: false
-            inherited_members: true
-            members_order: source
-            separate_signature: true
-            unwrap_annotated: true
-            filters: ["!^_"]
-            merge_init_into_class: true
-            docstring_section_style: spacy
-
-markdown_extensions:
-  - pymdownx.highlight:
-      anchor_linenums: true
-      line_spans: __span
-      pygments_lang_class: true
-  - pymdownx.inlinehilite
-  - pymdownx.snippets
-  - pymdownx.superfences
-  - pymdownx.tabbed:
-      alternate_style: true
-  - admonition
-  - pymdownx.details
-  - pymdownx.emoji:
-      emoji_index: !!python/name:material.extensions.emoji.twemoji
-      emoji_generator: !!python/name:material.extensions.emoji.to_svg
-  - attr_list
-  - md_in_html
-
-nav:
-  - Home: index.md
-  - Getting Started:
-      - Installation: getting-started/installation.md
-      - Quickstart: getting-started/quickstart.md
-      - Authentication: getting-started/authentication.md
-  - User Guide:
-      - Basic Usage: guide/basic-usage.md
-      - Advanced Features: guide/advanced-features.md
-      - Best Practices: guide/best-practices.md
-  - API Reference:
-      - Client: api/client.md
-      - Agents: api/agents.md
-      - Evaluations: api/evaluations.md
-      - Models: api/models.md
-  - Examples:
-      - CI/CD Integration: examples/ci-integration.md
-      - Batch Processing: examples/batch-processing.md
-      - Webhooks: examples/webhooks.md
-  - Changelog: changelog.md
-
-extra:
-  social:
-    - icon: fontawesome/brands/github
-      link: https://github.com/eval-ai
-    - icon: fontawesome/brands/discord
-      link: https://discord.gg/eval
-    - icon: fontawesome/brands/twitter
-      link: https://twitter.com/eval_ai
-'''
-
-MKDOCS_INDEX = '''# Agent Evaluation SDK
-
-Welcome to the official Python SDK documentation for the AI Agent Evaluation Platform!
-
-## What is this SDK?
-
-The Agent Evaluation SDK provides a simple, powerful interface to evaluate AI agents against standardized test suites. Whether you're building LLMs, conversational agents, or autonomous systems, our SDK helps you measure and improve performance.
-
-## Quick Example
-
-```python
-from agent_eval_sdk import EvalClient
-
-# Initialize client
-client = EvalClient(api_key="your_api_key")
-
-# Quick evaluation
-results = client.quick_evaluate(
-    agent_name="My Agent",
-    agent_model="gpt-4"
-)
-
-print(f"Score: {results.overall_score:.1%}")
-```
-
-## Key Features
-
-- 🚀 **Simple API** - Get started in minutes
-- 📊 **Comprehensive Metrics** - Detailed performance breakdowns
-- ⚡ **Async Support** - Non-blocking evaluation runs
-- 🔄 **CI/CD Ready** - Perfect for automation
-- 📈 **Progress Tracking** - Real-time status updates
-- 🪝 **Webhooks** - Event-driven notifications
-
-## Installation
-
-=== "pip"
-
-    ```bash
-    pip install agent-eval-sdk
-    ```
-
-=== "poetry"
-
-    ```bash
-    poetry add agent-eval-sdk
-    ```
-
-=== "requirements.txt"
-
-    ```text
-    agent-eval-sdk>=2.0.0
-    ```
-
-## Next Steps
-
-- [Quickstart Guide](getting-started/quickstart.md) - Get running in 5 minutes
-- [API Reference](api/client.md) - Complete API documentation  
-- [Examples](examples/ci-integration.md) - Real-world use cases
-
-## Need Help?
-
-- 📚 Check our [User Guide](guide/basic-usage.md)
-- 💬 Join our [Discord Community](https://discord.gg/eval)
-- 🐛 Report issues on [GitHub](https://github.com/eval-ai/python-sdk/issues)
-'''
-
-MKDOCS_API_CLIENT = '''# Client API Reference
-
-::: agent_eval_sdk.EvalClient
-    options:
-      show_source: true
-      show_signature_annotations: true
-      members:
-        - __init__
-        - quick_evaluate
-        - health_check
-      heading_level: 2
-
-## Sub-APIs
+    file_actions = []
+    if not VERBOSE:
+        file_actions = [(os.POSIX_SPAWN_OPEN, fd, os.devnull, os.O_WRONLY, 0)
+                        for fd in (1, 2)]
+    pid = os.posix_spawn(argv[0], argv, os.environ, file_actions=file_actions)
+    _, status = os.waitpid(pid, 0)
+    _check_exit(argv, os.waitstatus_to_exitcode(status))
 
-The client provides access to specialized APIs through these attributes:
 
-### agents
+def _check_exit(argv, code):
+    """Raise RuntimeError if a spawned tool exited non-zero"""
+    if code:
+        hint = "" if VERBOSE else "; rerun with --verbose for its output"
+        raise RuntimeError(f"{Path(argv[0]).name} failed with exit code {code}{hint}")
 
-::: agent_eval_sdk.AgentsAPI
-    options:
-      show_source: false
-      heading_level: 3
 
-### evaluations  
+def write_files(files):
+    """Write each path -> content pair in files as UTF-8 text under ROOT"""
+    for path, content in files.items():
+        write_if_changed(ROOT / path, content)
 
-::: agent_eval_sdk.EvaluationsAPI
-    options:
-      show_source: false
-      heading_level: 3
 
-### test_suites
+def write_if_changed(path, content):
+    """Write content to path unless the file already holds exactly that
 
-::: agent_eval_sdk.TestSuitesAPI
-    options:
-      show_source: false
-      heading_level: 3
+    Leaving identical files untouched keeps their mtimes, so Sphinx's
+    incremental build and the MkDocs up-to-date check don't see a change.
 
-### webhooks
+    Returns:
+        True if the file was written
+    """
+    data = content.encode("utf-8")
+    try:
+        if path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+    path.write_bytes(data)
+    return True
 
-::: agent_eval_sdk.WebhooksAPI
-    options:
-      show_source: false
-      heading_level: 3
 
-## Utility Functions
+# === TEMPLATES ===
 
-::: agent_eval_sdk.get_client_from_env
-    options:
-      show_source: true
-      heading_level: 3
-'''
+TEMPLATE_DIR = Path(__file__).with_name("_doc_templates")
 
-# === PDOC CONFIGURATION ===
 
-PDOC_TEMPLATE = '''
-<!doctype html>
-<html lang="en">
-<head>
-    <meta charset="utf-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1">
-    <title>{{ module.name }} - Agent Evaluation SDK</title>
-    <style>
-        /* Custom styling for better appearance */
-        body { font-family: system-ui, -apple-system, sans-serif; }
-        .header { background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); }
-        code { background: #f4f4f4; padding: 2px 4px; border-radius: 3px; }
-        pre { background: #f8f8f8; padding: 1em; border-radius: 5px; }
-        .module { margin-bottom: 2em; }
-        .class { border-left: 3px solid #667eea; padding-left: 1em; }
-        .function { border-left: 3px solid #764ba2; padding-left: 1em; }
-    </style>
-</head>
-<body>
-    {{ content }}
-</body>
-</html>
-'''
+@cache
+def _template(name):
+    """Read a file from _doc_templates/ on first use and keep it in memory"""
+    return (TEMPLATE_DIR / name).read_text(encoding="utf-8")
 
 
 # === GENERATION SCRIPTS ===
 
-def generate_sphinx_docs():
-    """Generate documentation using Sphinx"""
+def generate_sphinx_docs(full_rebuild=False):
+    """Generate documentation using Sphinx
+
+    Set full_rebuild to ignore Sphinx's saved environment and reread every
+    source file.
+    """
     print("\n📚 Generating Sphinx Documentation...")
 
     # Write configuration files
-    with open("docs/source/conf.py", "w") as f:
-        f.write(SPHINX_CONF)
-
-    with open("docs/source/index.rst", "w") as f:
-        f.write(SPHINX_INDEX)
-
-    with open("docs/source/quickstart.rst", "w") as f:
-        f.write(SPHINX_QUICKSTART)
-
-    # Initialize Sphinx project if needed
-    if not Path("docs/source/Makefile").exists():
-        subprocess.run(["sphinx-quickstart", "docs/source", "--quiet",
-                        "--project=Agent Evaluation SDK",
-                        "--author=Team", "-v=2.0.0", "--makefile"])
-
-    # Build HTML documentation
-    subprocess.run(["sphinx-build", "-b", "html", "docs/source", "docs/build/html"])
+    write_files({
+        "docs/source/conf.py": _template("sphinx_conf.py.tmpl"),
+        "docs/source/index.rst": _template("sphinx_index.rst"),
+        "docs/source/quickstart.rst": _template("sphinx_quickstart.rst"),
+        # The standard make wrappers, without a sphinx-quickstart run
+        "docs/source/Makefile": _template("sphinx_makefile"),
+        "docs/source/make.bat": _template("sphinx_make.bat"),
+    })
+
+    # Build HTML documentation in-process, reading sources on all cores
+    from sphinx.cmd.build import build_main
+
+    args = ["-b", "html", "-j", "auto", "--keep-going"]
+    if not VERBOSE:
+        args.append("-Q")  # Unlike -q, also silences warnings
+    if full_rebuild:
+        args.append("-E")
+    code = build_main([*args, str(ROOT / "docs/source"), str(ROOT / "docs/build/html")])
+    _check_exit(["sphinx-build"], code)
 
     print("✅ Sphinx docs generated at: docs/build/html/index.html")
     print("   View with: python -m http.server 8000 --directory docs/build/html")
@@ -552,12 +201,20 @@ def generate_pdoc_docs():
     """Generate documentation using pdoc"""
     print("\n📚 Generating pdoc Documentation...")
 
-    # Generate HTML documentation
-    subprocess.run(["pdoc", "--html", "--output-dir", "docs/pdoc",
-                    "--config", "show_source_code=True",
-                    "--config",
-                    "git_link_template='https://github.com/eval-ai/python-sdk/blob/main/{path}#L{start_line}-L{end_line}'",
-                    "agent_eval_sdk"])
+    # Generate HTML documentation in-process with the modern pdoc API
+    import pdoc
+    import pdoc.render
+
+    pdoc.render.configure(
+        # custom.css and a page title override, layered over pdoc's theme
+        template_directory=TEMPLATE_DIR / "pdoc",
+        show_source=True,
+        # pdoc appends ".py" to the mapped prefix for a single-file module
+        edit_url_map={
+            "agent_eval_sdk": "https://github.com/eval-ai/python-sdk/blob/main/agent_eval_sdk",
+        },
+    )
+    pdoc.pdoc("agent_eval_sdk", output_directory=ROOT / "docs/pdoc")
 
     print("✅ pdoc docs generated at: docs/pdoc/agent_eval_sdk.html")
     print("   View with: python -m http.server 8001 --directory docs/pdoc")
@@ -567,89 +224,121 @@ def generate_mkdocs_docs():
     """Generate documentation using MkDocs"""
     print("\n📚 Generating MkDocs Documentation...")
 
-    # Write configuration
-    with open("mkdocs.yml", "w") as f:
-        f.write(MKDOCS_CONFIG)
-
     # Create docs directory structure
-    Path("docs/getting-started").mkdir(parents=True, exist_ok=True)
-    Path("docs/guide").mkdir(parents=True, exist_ok=True)
-    Path("docs/api").mkdir(parents=True, exist_ok=True)
-    Path("docs/examples").mkdir(parents=True, exist_ok=True)
+    make_doc_dirs("getting-started", "guide", "api", "examples")
+
+    # Write configuration, index and API reference page
+    write_files({
+        "mkdocs.yml": _template("mkdocs.yml"),
+        "docs/index.md": _template("mkdocs_index.md"),
+        "docs/api/client.md": _template("mkdocs_api_client.md"),
+    })
+
+    mode = mkdocs_build_mode()
+    if mode is None:
+        print("✅ MkDocs docs up to date at: site/index.html")
+        return
+
+    # Build the documentation in-process; a dirty build re-renders only
+    # the pages whose own file changed
+    from mkdocs.commands.build import build
+    from mkdocs.config import load_config
+
+    started = time.time()
+    build(load_config(str(ROOT / "mkdocs.yml")), dirty=mode == "dirty")
+    precompress_site()
+    # Stamp with the start time so edits made during the build still count
+    MKDOCS_STAMP.touch()
+    os.utime(MKDOCS_STAMP, (started, started))
 
-    # Write index
-    with open("docs/index.md", "w") as f:
-        f.write(MKDOCS_INDEX)
+    print("✅ MkDocs docs generated at: site/index.html")
+    print("   Serve live with: mkdocs serve")
 
-    # Write API reference page
-    with open("docs/api/client.md", "w") as f:
-        f.write(MKDOCS_API_CLIENT)
 
-    # Build the documentation
-    subprocess.run(["mkdocs", "build"])
+MKDOCS_STAMP = ROOT / "site/.build-stamp"
+
+
+def mkdocs_build_mode():
+    """Decide how much of site/ needs rebuilding since the last build
+
+    Returns:
+        None if the site is current, "dirty" if only some pages changed, or
+        "full" if there is no previous build or the config or SDK source
+        changed. The API pages render from the SDK module, not from their
+        own .md file, so a dirty build would leave them stale.
+    """
+    if not MKDOCS_STAMP.exists():
+        return "full"
+
+    built_at = MKDOCS_STAMP.stat().st_mtime
+
+    def changed(paths):
+        return any(p.stat().st_mtime > built_at for p in paths if p.exists())
+
+    if changed([ROOT / "mkdocs.yml", SDK_SOURCE]):
+        return "full"
+    if changed((ROOT / "docs").rglob("*.md")):
+        return "dirty"
+    return None
 
-    print("✅ MkDocs docs generated at: site/index.html")
-    print("   Serve live with: mkdocs serve")
+
+PRECOMPRESS_SUFFIXES = {".html", ".css", ".js", ".json", ".svg"}
+
+
+def precompress_site(site=ROOT / "site"):
+    """Write .gz and .br copies of text assets for static precompressed serving
+
+    Servers configured for it (nginx gzip_static, Caddy precompressed) send
+    these directly instead of compressing on every request.
+    """
+    files = [p for p in Path(site).rglob("*")
+             if p.suffix in PRECOMPRESS_SUFFIXES and p.is_file()]
+    # zlib and brotli release the GIL while compressing, so threads scale
+    with ThreadPoolExecutor() as executor:
+        list(executor.map(_precompress_file, files))
+
+
+def _precompress_file(path):
+    """Write compressed sidecars for one file, skipping ones already current"""
+    modified = path.stat().st_mtime
+    gz = path.with_name(path.name + ".gz")
+    br = path.with_name(path.name + ".br")
+    stale_gz = not gz.exists() or gz.stat().st_mtime < modified
+    stale_br = brotli is not None and (not br.exists() or br.stat().st_mtime < modified)
+    if not (stale_gz or stale_br):
+        return
+
+    data = path.read_bytes()
+    if stale_gz:
+        gz.write_bytes(gzip.compress(data, 9))
+    if stale_br:
+        br.write_bytes(brotli.compress(data, quality=11))
 
 
 # === COMPARISON SCRIPT ===
 
 def compare_generators():
     """Generate comparison of different documentation tools"""
-
-    comparison = """
-# Documentation Generator Comparison
-
-## 1. Sphinx (Classic & Comprehensive)
-   ✅ Pros:
-   - Industry standard for Python projects
-   - Extensive customization options
-   - Great for large projects
-   - Supports multiple output formats (HTML, PDF, ePub)
-   - Rich extension ecosystem
-
-   ❌ Cons:
-   - Steeper learning curve
-   - reStructuredText can be less intuitive
-   - More configuration required
-
-## 2. pdoc (Simple & Fast)
-   ✅ Pros:
-   - Zero configuration needed
-   - Fast generation
-   - Clean, simple output
-   - Supports Markdown in docstrings
-
-   ❌ Cons:
-   - Less customization
-   - Fewer features
-   - No multi-page navigation
-
-## 3. MkDocs (Modern & Beautiful)
-   ✅ Pros:
-   - Beautiful Material theme
-   - Markdown-based
-   - Great search functionality
-   - Live reload during development
-   - Good for mixing auto-generated and manual docs
-
-   ❌ Cons:
-   - Requires more manual content creation
-   - mkdocstrings plugin needed for auto-generation
-
-## Recommendation:
-- **For your use case**: MkDocs with mkdocstrings
-  - Modern, beautiful output
-  - Good balance of automation and control
-  - Excellent developer experience
-  - Easy to integrate custom guides with auto-generated API docs
-"""
-
+    comparison = _template("comparison.md")
     print(comparison)
 
     # Write comparison to file
-    with open("docs/comparison.md", "w") as f:
-        f.write(comparison)
+    write_if_changed(ROOT / "docs/comparison.md", comparison)
+
+
+def _set_verbose(verbose):
+    """Apply --verbose in this process, including build worker processes
+
+    MkDocs and pdoc report through logging rather than stdout; without a
+    handler their warnings would still reach stderr via logging's fallback.
+    """
+    global VERBOSE
+    VERBOSE = verbose
+    if verbose:
+        logging.basicConfig(level=logging.INFO, format="%(levelname)s - %(name)s: %(message)s")
+    else:
+        for name in ("mkdocs", "pdoc"):
+            logging.getLogger(name).setLevel(logging.ERROR)
 
 
 # === MAIN EXECUTION ===
@@ -658,27 +347,41 @@ if __name__ == "__main__":
     import argparse
 
     parser = argparse.ArgumentParser(description="Generate SDK documentation")
-    parser.add_argument("--tool", choices=["sphinx", "pdoc", "mkdocs", "all", "compare"],
-                        default="all", help="Documentation tool to use")
+    parser.add_argument("--tool", choices=["sphinx", "pdoc", "mkdocs", "compare", "all"],
+                        action="append",
+                        help="Documentation tool to use; repeat to pick several (default: all)")
     parser.add_argument("--setup", action="store_true",
                         help="Install required packages")
+    parser.add_argument("--verbose", "-v", action="store_true",
+                        help="Show the output of the underlying tools")
 
     args = parser.parse_args()
+    _set_verbose(args.verbose)
 
     if args.setup:
         setup_directories()
         install_doc_tools()
 
-    if args.tool == "sphinx" or args.tool == "all":
-        generate_sphinx_docs()
-
-    if args.tool == "pdoc" or args.tool == "all":
-        generate_pdoc_docs()
-
-    if args.tool == "mkdocs" or args.tool == "all":
-        generate_mkdocs_docs()
-
-    if args.tool == "compare" or args.tool == "all":
+    TOOLS = {
+        "sphinx": generate_sphinx_docs,
+        "pdoc": generate_pdoc_docs,
+        "mkdocs": generate_mkdocs_docs,
+        "compare": compare_generators,
+    }
+    selected = list(TOOLS) if not args.tool or "all" in args.tool else list(dict.fromkeys(args.tool))
+    builds = [TOOLS[tool] for tool in selected if tool != "compare"]
+
+    # The builds are independent but run in-process and are CPU-bound, so
+    # give each its own process: that sidesteps the GIL and keeps Sphinx's
+    # working-directory changes away from the other builds
+    if builds:
+        with ProcessPoolExecutor(max_workers=len(builds), initializer=_set_verbose,
+                                 initargs=(VERBOSE,)) as executor:
+            for future in [executor.submit(build) for build in builds]:
+                future.result()
+
+    # The comparison prints a long summary, so keep it after the build output
+    if "compare" in selected:
         compare_generators()
 
     print("\n🎉 Documentation generation complete!")
@@ -0,0 +1,18 @@
+"""Shared fixtures for the SDK tests."""
+
+import pytest
+
+from api_sdk_1 import agent_eval_sdk
+from tests.stub_api import StubAPI
+
+
+@pytest.fixture
+def api():
+    stub = StubAPI()
+    yield stub
+    stub.close()
+
+
+@pytest.fixture
+def client(api):
+    return agent_eval_sdk.EvalClient(api_key="test_key", base_url=api.url)
@@ -0,0 +1,122 @@
+"""A local HTTP stub standing in for the evaluation API, plus payload helpers."""
+
+import json
+import threading
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+
+@dataclass
+class Recorded:
+    """A request received by the stub."""
+
+    method: str
+    path: str
+    query: Dict[str, List[str]]
+    headers: Dict[str, str]
+    body: bytes
+
+
+# A handler returns (status, JSON body or None, extra headers)
+Handler = Callable[[Recorded], Tuple[int, Optional[Any], Dict[str, str]]]
+
+
+class StubAPI:
+    """In-process HTTP server with per-test routes.
+
+    Attributes:
+        url: Base URL to pass to the client
+        requests: Every request received, in order
+    """
+
+    def __init__(self):
+        self.routes: Dict[Tuple[str, str], Handler] = {}
+        self.requests: List[Recorded] = []
+        stub = self
+
+        class RequestHandler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self) -> None:
+                self._dispatch("GET")
+
+            def do_POST(self) -> None:
+                self._dispatch("POST")
+
+            def _dispatch(self, method: str) -> None:
+                url = urlparse(self.path)
+                body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                request = Recorded(method, url.path, parse_qs(url.query),
+                                   dict(self.headers), body)
+                stub.requests.append(request)
+                handler = stub.routes.get((method, url.path))
+                if handler is None:
+                    status, payload, headers = 404, {"error": "not found"}, {}
+                else:
+                    status, payload, headers = handler(request)
+                data = b"" if payload is None else json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), RequestHandler)
+        self._server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self._server.server_address[1]}/v1"
+        threading.Thread(target=self._server.serve_forever, kwargs={"poll_interval": 0.05},
+                         daemon=True).start()
+
+    def route(self, method: str, path: str, handler: Handler) -> None:
+        """Serve handler for method requests to path under /v1."""
+        self.routes[(method, f"/v1{path}")] = handler
+
+    def requests_to(self, path: str) -> List[Recorded]:
+        """Get the recorded requests for a path under /v1."""
+        return [r for r in self.requests if r.path == f"/v1{path}"]
+
+    def close(self) -> None:
+        """Stop serving and release the port."""
+        self._server.shutdown()
+        self._server.server_close()
+
+
+def evaluation_data(status: str = "running", score: float = 0.9) -> Dict[str, Any]:
+    """Build an evaluation payload as the API returns it."""
+    data = {
+        "id": "eval_1",
+        "agent_id": "agent_1",
+        "test_suite_id": "suite_001",
+        "status": status,
+        "created_at": "2024-01-01T00:00:00Z",
+        "organization": "org",
+    }
+    if status == "completed":
+        data["results"] = {
+            "overall_score": score,
+            "passed_tests": 9,
+            "failed_tests": 1,
+            "categories": {"reasoning": score},
+            "execution_time_seconds": 1.5,
+        }
+    return data
+
+
+def completes_after(polls: int) -> Handler:
+    """Serve a running evaluation that completes on the given poll."""
+    count = 0
+
+    def handler(request: Recorded):
+        nonlocal count
+        count += 1
+        status = "completed" if count >= polls else "running"
+        return 200, evaluation_data(status), {}
+
+    return handler
@@ -0,0 +1,448 @@
+"""Tests for agent_eval_sdk against a local HTTP stub of the API."""
+
+import asyncio
+import gzip
+import json
+import math
+import os
+import threading
+import time
+import urllib.request
+
+import pytest
+
+from api_sdk_1 import agent_eval_sdk
+from api_sdk_1.agent_eval_sdk import (
+    Agent, AsyncEvalClient, AsyncEvaluation, EvalException, Evaluation, EvaluationResults,
+)
+from tests.stub_api import completes_after, evaluation_data
+
+SUITES = [
+    {"id": f"suite_00{i}", "name": f"Suite {i}", "description": "", "test_count": 10,
+     "categories": ["reasoning"], "created_at": "2024-01-01T00:00:00Z"}
+    for i in (1, 2)
+]
+
+
+def agent_created(request):
+    body = json.loads(gzip.decompress(request.body)
+                      if request.headers.get("Content-Encoding") == "gzip" else request.body)
+    return 201, {**body, "id": "agent_1", "created_at": "2024-01-01T00:00:00Z",
+                 "organization": "org"}, {}
+
+
+def make_evaluation(client):
+    return Evaluation(client, evaluation_data("pending"))
+
+
+def results_with(score):
+    return EvaluationResults(score, 0, 0, {}, 0)
+
+
+# === POLLING ===
+
+def test_poll_waits_for_completion(api, client):
+    api.route("GET", "/evaluations/eval_1", completes_after(4))
+
+    results = make_evaluation(client).wait_for_completion(timeout=10)
+
+    assert results.overall_score == 0.9
+    assert len(api.requests_to("/evaluations/eval_1")) == 4
+
+
+def test_poll_backs_off_through_server_errors(api, client):
+    handler = completes_after(3)
+    calls = []
+
+    def flaky(request):
+        calls.append(request)
+        if len(calls) <= 2:
+            return 500, {"error": "boom"}, {}
+        return handler(request)
+
+    api.route("GET", "/evaluations/eval_1", flaky)
+
+    results = make_evaluation(client).wait_for_completion(timeout=10)
+
+    assert results.passed_tests == 9
+
+
+def test_poll_times_out(api, client):
+    api.route("GET", "/evaluations/eval_1", lambda r: (200, evaluation_data(), {}))
+
+    with pytest.raises(TimeoutError):
+        make_evaluation(client).wait_for_completion(timeout=0.5)
+
+
+def test_failed_evaluation_raises(api, client):
+    api.route("GET", "/evaluations/eval_1", lambda r: (200, evaluation_data("failed"), {}))
+
+    with pytest.raises(EvalException):
+        make_evaluation(client).wait_for_completion(timeout=5)
+
+
+def test_polling_interval_is_still_importable():
+    assert agent_eval_sdk.POLLING_INTERVAL == 2
+
+
+def test_unknown_wait_mode_is_rejected(client):
+    with pytest.raises(ValueError):
+        make_evaluation(client).wait_for_completion(mode="carrier-pigeon")
+
+
+# === LONG POLLING ===
+
+def test_longpoll_sends_wait_and_completes(api, client):
+    def held(request):
+        time.sleep(0.3)
+        return 200, evaluation_data("completed"), {}
+
+    api.route("GET", "/evaluations/eval_1", held)
+
+    results = make_evaluation(client).wait_for_completion(timeout=60, mode="longpoll")
+
+    assert results.overall_score == 0.9
+    assert api.requests_to("/evaluations/eval_1")[0].query["wait"] == ["30"]
+
+
+def test_longpoll_wait_is_clamped_to_deadline(api, client):
+    def held(request):
+        time.sleep(3)
+        return 200, evaluation_data(), {}
+
+    api.route("GET", "/evaluations/eval_1", held)
+
+    with pytest.raises(TimeoutError):
+        make_evaluation(client).wait_for_completion(timeout=1, mode="longpoll")
+    assert api.requests_to("/evaluations/eval_1")[0].query["wait"] == ["1"]
+
+
+def test_longpoll_falls_back_to_polling(api, client):
+    # Answers immediately, ignoring ``wait``
+    api.route("GET", "/evaluations/eval_1", completes_after(3))
+
+    results = make_evaluation(client).wait_for_completion(timeout=10, mode="longpoll")
+
+    assert results.overall_score == 0.9
+    requests = api.requests_to("/evaluations/eval_1")
+    assert "wait" in requests[0].query
+    assert "wait" not in requests[-1].query
+
+
+# === WEBHOOKS ===
+
+def test_webhook_notification_completes_wait(api, client):
+    state = {"status": "running"}
+    checked = threading.Event()
+
+    def register(request):
+        url = json.loads(request.body)["url"]
+
+        def finish():
+            # Complete only once the waiter has seen "running" and is
+            # listening, so the callback is what wakes it
+            checked.wait(5)
+            state["status"] = "completed"
+            urllib.request.urlopen(urllib.request.Request(url, data=b"{}", method="POST"))
+
+        threading.Thread(target=finish, daemon=True).start()
+        return 201, {"id": "wh_1", "url": url}, {}
+
+    def status(request):
+        data = evaluation_data(state["status"])
+        checked.set()
+        return 200, data, {}
+
+    api.route("POST", "/webhooks", register)
+    api.route("GET", "/evaluations/eval_1", status)
+
+    # The periodic re-check is 30 seconds, so only the callback can finish
+    # this inside the timeout
+    results = make_evaluation(client).wait_for_completion(
+        timeout=10, mode="webhook", callback_host="127.0.0.1")
+
+    assert results.overall_score == 0.9
+
+
+def test_webhook_retries_transient_refresh_errors(api, client):
+    api.route("POST", "/webhooks", lambda r: (201, {"id": "wh_1", "url": ""}, {}))
+    calls = []
+
+    def flaky(request):
+        calls.append(request)
+        if len(calls) == 1:
+            return 503, {"error": "unavailable"}, {}
+        return 200, evaluation_data("completed"), {}
+
+    api.route("GET", "/evaluations/eval_1", flaky)
+
+    results = make_evaluation(client).wait_for_completion(
+        timeout=10, mode="webhook", callback_host="127.0.0.1")
+
+    assert results.overall_score == 0.9
+    assert len(calls) == 2
+
+
+def test_webhook_with_remote_callback_host_falls_back_to_polling(api, client):
+    # The listener must not try to bind to the advertised (non-local) name
+    api.route("POST", "/webhooks", lambda r: (500, {"error": "unavailable"}, {}))
+    api.route("GET", "/evaluations/eval_1", completes_after(2))
+
+    results = make_evaluation(client).wait_for_completion(
+        timeout=10, mode="webhook", callback_host="eval-client.example.com")
+
+    assert results.overall_score == 0.9
+    registered = json.loads(api.requests_to("/webhooks")[0].body)["url"]
+    assert registered.startswith("http://eval-client.example.com:")
+
+
+# === CONDITIONAL REQUESTS ===
+
+def test_refresh_revalidates_with_etag(api, client):
+    def handler(request):
+        if request.headers.get("If-None-Match") == '"v1"':
+            return 304, None, {"ETag": '"v1"'}
+        return 200, evaluation_data(), {"ETag": '"v1"'}
+
+    api.route("GET", "/evaluations/eval_1", handler)
+    evaluation = make_evaluation(client)
+
+    evaluation.refresh()
+    evaluation.refresh()
+
+    first, second = api.requests_to("/evaluations/eval_1")
+    assert "If-None-Match" not in first.headers
+    assert second.headers["If-None-Match"] == '"v1"'
+    assert evaluation.status == "running"
+
+
+# === CLIENT ===
+
+def test_sub_apis_are_created_on_first_access(client):
+    assert "agents" not in vars(client)
+
+    agents = client.agents
+
+    assert vars(client)["agents"] is agents
+    assert client.agents is agents
+    assert agents.client is client
+    with pytest.raises(AttributeError):
+        client.not_an_api
+
+
+def test_http2_client_follows_redirects(api):
+    pytest.importorskip("h2")
+    api.route("GET", "/health", lambda r: (307, None, {"Location": f"{api.url}/status"}))
+    api.route("GET", "/status", lambda r: (200, {"status": "ok"}, {}))
+    client = agent_eval_sdk.EvalClient(api_key="test_key", base_url=api.url, http2=True)
+
+    try:
+        assert client.health_check() == {"status": "ok"}
+    finally:
+        client.close()
+
+
+# === REQUEST BODIES ===
+
+def test_request_bodies_are_not_compressed_by_default(api, client):
+    api.route("POST", "/agents", agent_created)
+
+    client.agents.create(name="Agent", model="gpt-4",
+                         description="x" * 2 * agent_eval_sdk.GZIP_MIN_BYTES)
+
+    assert "Content-Encoding" not in api.requests_to("/agents")[0].headers
+
+
+def test_large_request_bodies_are_gzipped_when_enabled(api):
+    api.route("POST", "/agents", agent_created)
+    client = agent_eval_sdk.EvalClient(api_key="test_key", base_url=api.url,
+                                       compress_requests=True)
+    description = "x" * 2 * agent_eval_sdk.GZIP_MIN_BYTES
+
+    client.agents.create(name="Small", model="gpt-4")
+    agent = client.agents.create(name="Large", model="gpt-4", description=description)
+
+    small, large = api.requests_to("/agents")
+    assert "Content-Encoding" not in small.headers
+    assert large.headers["Content-Encoding"] == "gzip"
+    assert agent.description == description
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_non_string_metadata_keys_are_encoded(api, client, monkeypatch, use_orjson):
+    if use_orjson:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(agent_eval_sdk, "orjson", None)
+    api.route("POST", "/agents", agent_created)
+
+    agent = client.agents.create(name="Agent", model="gpt-4", metadata={1: "a"})
+
+    assert json.loads(api.requests_to("/agents")[0].body)["metadata"] == {"1": "a"}
+    assert agent.metadata == {"1": "a"}
+
+
+# === SHARED SESSION ===
+
+def test_shared_session_does_not_share_cookies(api):
+    api.route("GET", "/health",
+              lambda r: (200, {"status": "ok"}, {"Set-Cookie": "session=a; Path=/"}))
+
+    agent_eval_sdk.EvalClient(api_key="key_a", base_url=api.url).health_check()
+    agent_eval_sdk.EvalClient(api_key="key_b", base_url=api.url).health_check()
+
+    first, second = api.requests_to("/health")
+    assert second.headers["X-API-Key"] == "key_b"
+    assert "Cookie" not in second.headers
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+@pytest.mark.filterwarnings("ignore::DeprecationWarning")
+def test_forked_child_gets_its_own_session():
+    parent_session = agent_eval_sdk.get_session()
+    read_end, write_end = os.pipe()
+
+    pid = os.fork()
+    if pid == 0:
+        fresh = agent_eval_sdk.get_session() is not parent_session
+        os.write(write_end, b"1" if fresh else b"0")
+        os._exit(0)
+
+    os.close(write_end)
+    reported = os.read(read_end, 1)
+    os.close(read_end)
+    os.waitpid(pid, 0)
+
+    assert reported == b"1"
+    assert agent_eval_sdk.get_session() is parent_session
+
+
+# === ASYNC CLIENT ===
+
+def test_async_evaluation_does_not_inherit_sync_waiters():
+    assert not issubclass(AsyncEvaluation, Evaluation)
+    assert not hasattr(AsyncEvaluation, "_wait_longpoll")
+    assert not hasattr(AsyncEvaluation, "_wait_webhook")
+
+
+def test_async_quick_evaluate_many(api):
+    pytest.importorskip("httpx")
+    api.route("POST", "/agents", agent_created)
+    api.route("POST", "/evaluations", lambda r: (201, evaluation_data("pending"), {}))
+    api.route("GET", "/evaluations/eval_1", lambda r: (200, evaluation_data("completed"), {}))
+
+    async def run():
+        async with AsyncEvalClient(api_key="test_key", base_url=api.url) as client:
+            return await client.quick_evaluate_many(
+                [{"agent_name": f"Agent {i}", "agent_model": "gpt-4"} for i in range(3)],
+                concurrency=2)
+
+    results = asyncio.run(run())
+
+    assert [r.overall_score for r in results] == [0.9, 0.9, 0.9]
+    assert len(api.requests_to("/agents")) == 3
+
+
+def test_async_suite_cache(api):
+    pytest.importorskip("httpx")
+    api.route("GET", "/test-suites", lambda r: (200, {"test_suites": SUITES}, {}))
+
+    async def run():
+        async with AsyncEvalClient(api_key="test_key", base_url=api.url) as client:
+            await client.test_suites.list()
+            suite = await client.test_suites.get("suite_002")
+            client.test_suites.clear_cache()
+            await client.test_suites.list()
+            return suite
+
+    assert asyncio.run(run()).name == "Suite 2"
+    assert len(api.requests_to("/test-suites")) == 2
+
+
+def test_async_client_follows_redirects(api):
+    pytest.importorskip("httpx")
+    api.route("GET", "/health", lambda r: (307, None, {"Location": f"{api.url}/status"}))
+    api.route("GET", "/status", lambda r: (200, {"status": "ok"}, {}))
+
+    async def run():
+        async with AsyncEvalClient(api_key="test_key", base_url=api.url) as client:
+            return await client.health_check()
+
+    assert asyncio.run(run()) == {"status": "ok"}
+
+
+# === TEST SUITE CACHE ===
+
+def test_suite_list_is_cached_until_cleared(api, client):
+    api.route("GET", "/test-suites", lambda r: (200, {"test_suites": SUITES}, {}))
+
+    assert [s.id for s in client.test_suites.list()] == ["suite_001", "suite_002"]
+    client.test_suites.list()
+    assert client.test_suites.get("suite_002").name == "Suite 2"
+    assert len(api.requests) == 1
+
+    client.test_suites.clear_cache()
+    client.test_suites.list()
+    assert len(api.requests) == 2
+
+
+def test_suite_get_fetches_by_id(api, client):
+    api.route("GET", "/test-suites/suite_002", lambda r: (200, SUITES[1], {}))
+
+    assert client.test_suites.get("suite_002").name == "Suite 2"
+    assert client.test_suites.get("suite_002").name == "Suite 2"
+    assert len(api.requests) == 1
+
+
+def test_suite_get_falls_back_to_list(api, client):
+    api.route("GET", "/test-suites", lambda r: (200, {"test_suites": SUITES}, {}))
+
+    assert client.test_suites.get("suite_001").name == "Suite 1"
+    assert client.test_suites.get("suite_999") is None
+
+
+# === EVALUATION LIST ===
+
+def test_evaluation_list_encodes_filters(api, client):
+    api.route("GET", "/evaluations", lambda r: (200, {"evaluations": []}, {}))
+
+    client.evaluations.list(page=2, limit=500, status="a b&c=d")
+
+    assert api.requests[0].query == {"page": ["2"], "limit": ["100"], "status": ["a b&c=d"]}
+
+
+# === MODELS ===
+
+def test_from_dict_ignores_unknown_keys():
+    agent = Agent.from_dict({"id": "agent_1", "name": "A", "model": "gpt-4", "version": "1",
+                             "created_at": "2024-01-01T00:00:00Z", "organization": "org",
+                             "new_field": True})
+    suite = agent_eval_sdk.TestSuite.from_dict({**SUITES[0], "new_field": True})
+    results = EvaluationResults.from_dict({**evaluation_data("completed")["results"],
+                                           "new_field": True})
+
+    assert (agent.description, agent.metadata) == ("", {})
+    assert suite.id == "suite_001"
+    assert results.overall_score == 0.9
+
+
+# === GRADES ===
+
+GRADED_SCORES = [
+    (1.0, "A+"), (0.9, "A+"), (0.89, "A"), (0.85, "A"), (0.8, "B"),
+    (0.7, "C"), (0.6, "D"), (0.59, "F"), (0.0, "F"), (math.nan, "F"),
+]
+
+
+@pytest.mark.parametrize("score, grade", GRADED_SCORES)
+def test_get_grade(score, grade):
+    assert results_with(score).get_grade() == grade
+
+
+def test_grades_for_agrees_with_get_grade():
+    pytest.importorskip("numpy")
+    scores = [score for score, _ in GRADED_SCORES]
+
+    grades = EvaluationResults.grades_for(scores)
+
+    assert list(grades) == [results_with(score).get_grade() for score in scores]
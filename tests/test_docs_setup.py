@@ -0,0 +1,135 @@
+"""Tests for the docs_setup build helpers."""
+
+import gzip
+import os
+from types import SimpleNamespace
+
+import pytest
+
+from api_sdk_1 import docs_setup
+
+
+def installed(*names):
+    """Fake importlib.metadata distributions with the given names."""
+    return lambda: [SimpleNamespace(metadata={"Name": name}) for name in names]
+
+
+# === TOOL INSTALLATION ===
+
+def test_install_doc_tools_installs_only_missing_packages(monkeypatch):
+    spawned = []
+    monkeypatch.setattr(docs_setup, "importlib",
+                        SimpleNamespace(util=SimpleNamespace(find_spec=lambda name: None)))
+    monkeypatch.setattr(docs_setup, "distributions",
+                        installed("Sphinx", "sphinx_rtd_theme", "pdoc", "mkdocs",
+                                  "mkdocs-material", "black"))
+    monkeypatch.setattr(docs_setup, "spawn", spawned.append)
+
+    docs_setup.install_doc_tools()
+
+    (argv,) = spawned
+    assert argv[argv.index("install") + 1:] == ["--no-input", "mkdocstrings[python]", "brotli"]
+
+
+def test_install_doc_tools_skips_pip_when_everything_is_installed(monkeypatch):
+    spawned = []
+    monkeypatch.setattr(docs_setup, "importlib",
+                        SimpleNamespace(util=SimpleNamespace(find_spec=lambda name: None)))
+    monkeypatch.setattr(docs_setup, "distributions",
+                        installed("sphinx", "sphinx-rtd-theme", "pdoc", "mkdocs",
+                                  "mkdocs_material", "mkdocstrings", "black", "Brotli"))
+    monkeypatch.setattr(docs_setup, "spawn", spawned.append)
+
+    docs_setup.install_doc_tools()
+
+    assert spawned == []
+
+
+# === TEMPLATE WRITES ===
+
+def test_write_if_changed_keeps_identical_files_untouched(tmp_path):
+    path = tmp_path / "index.rst"
+
+    assert docs_setup.write_if_changed(path, "Title\n") is True
+    os.utime(path, (1000, 1000))
+
+    assert docs_setup.write_if_changed(path, "Title\n") is False
+    assert path.stat().st_mtime == 1000
+
+    assert docs_setup.write_if_changed(path, "New title\n") is True
+    assert path.read_text(encoding="utf-8") == "New title\n"
+
+
+# === MKDOCS BUILD MODE ===
+
+@pytest.fixture
+def mkdocs_tree(tmp_path, monkeypatch):
+    """A built MkDocs project whose stamp is newer than every input."""
+    stamp = tmp_path / "site/.build-stamp"
+    sdk = tmp_path / "agent_eval_sdk.py"
+    page = tmp_path / "docs/index.md"
+    for path in (stamp, sdk, page, tmp_path / "mkdocs.yml"):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("")
+        os.utime(path, (1000, 1000))
+    os.utime(stamp, (2000, 2000))
+    monkeypatch.setattr(docs_setup, "ROOT", tmp_path)
+    monkeypatch.setattr(docs_setup, "MKDOCS_STAMP", stamp)
+    monkeypatch.setattr(docs_setup, "SDK_SOURCE", sdk)
+    return tmp_path
+
+
+def test_mkdocs_build_mode_skips_current_site(mkdocs_tree):
+    assert docs_setup.mkdocs_build_mode() is None
+
+
+def test_mkdocs_build_mode_without_stamp_is_full(mkdocs_tree):
+    (mkdocs_tree / "site/.build-stamp").unlink()
+
+    assert docs_setup.mkdocs_build_mode() == "full"
+
+
+@pytest.mark.parametrize("changed, mode", [
+    ("docs/index.md", "dirty"),
+    ("mkdocs.yml", "full"),
+    ("agent_eval_sdk.py", "full"),
+])
+def test_mkdocs_build_mode_after_a_change(mkdocs_tree, changed, mode):
+    os.utime(mkdocs_tree / changed, (3000, 3000))
+
+    assert docs_setup.mkdocs_build_mode() == mode
+
+
+# === PRECOMPRESSION ===
+
+def test_precompress_file_writes_and_refreshes_sidecars(tmp_path, monkeypatch):
+    monkeypatch.setattr(docs_setup, "brotli", None)
+    page = tmp_path / "index.html"
+    gz = tmp_path / "index.html.gz"
+    page.write_text("<p>v1</p>")
+    os.utime(page, (1000, 1000))
+
+    docs_setup._precompress_file(page)
+    assert gzip.decompress(gz.read_bytes()) == b"<p>v1</p>"
+    assert not (tmp_path / "index.html.br").exists()
+
+    # Up to date: left alone
+    os.utime(gz, (2000, 2000))
+    docs_setup._precompress_file(page)
+    assert gz.stat().st_mtime == 2000
+
+    # Source edited since: rewritten
+    page.write_text("<p>v2</p>")
+    os.utime(page, (3000, 3000))
+    docs_setup._precompress_file(page)
+    assert gzip.decompress(gz.read_bytes()) == b"<p>v2</p>"
+
+
+def test_precompress_file_writes_brotli_when_available(tmp_path):
+    brotli = pytest.importorskip("brotli")
+    page = tmp_path / "app.js"
+    page.write_text("console.log(1)")
+
+    docs_setup._precompress_file(page)
+
+    assert brotli.decompress((tmp_path / "app.js.br").read_bytes()) == b"console.log(1)"